@@ -1,32 +1,134 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, columns then go through the loop
+    np = None
+
+# Category codes of classify_nulls are indexes in this tuple.
+CATEGORIES = ("Nothing", "Cheese", "Zero", "Empty", "Fake", "Other")
+NOTHING, CHEESE, ZERO, EMPTY, FAKE, OTHER = range(len(CATEGORIES))
+
+# Title printed by NULL_not_found and category code of each null value,
+# looked up by exact type: True, 1 or 0.0 are not null values.
+TITLES = {
+    type(None): "Nothing:",
+    float: "Cheese:",
+    int: "Zero:",
+    str: "Empty:",
+    bool: "Fake:",
+}
+_CODES: Dict[type, Callable[[Any], int]] = {
+    type(None): lambda value: NOTHING,
+    float: lambda value: CHEESE if value != value else OTHER,
+    int: lambda value: ZERO if value == 0 else OTHER,
+    str: lambda value: EMPTY if value == "" else OTHER,
+    bool: lambda value: FAKE if value is False else OTHER,
+}
+
+
+def _other(value: Any) -> int:
+    """Code of the values of any other type."""
+    return OTHER
+
+
+def null_code(value: Any) -> int:
+    """
+    Return the category code of a single value.
+
+    Args:
+        value (Any): The value to classify.
+
+    Returns:
+        int: Its index in CATEGORIES.
+    """
+    return _CODES.get(type(value), _other)(value)
+
+
 def NULL_not_found(object: any) -> int:
-    title_dict = {
-        "NoneType": "Nothing:",
-        "float": "Cheese:" if object != object else None,
-        "int": "Zero:" if object == 0 else None,
-        "str": "Empty:" if object == "" else None,
-        "bool": "Fake:" if object == False else None,
-    }
-    
-    typ = type(object)
-    name = typ.__name__
-    title = title_dict.get(name)
-    
-    if title:
-        print(f"{title} {object} {object.__class__}")
+    code = null_code(object)
+    if code != OTHER:
+        print(f"{TITLES[type(object)]} {object} {object.__class__}")
         return 0
     else:
         print("Type not Found")
         return 1
 
-Nothing = None
-Garlic = float("NaN")
-Zero = 0
-Empty = ''
-Fake = False
-
-NULL_not_found(Nothing)
-NULL_not_found(Garlic)
-NULL_not_found(Zero)
-NULL_not_found(Empty)
-NULL_not_found(Fake)
-print(NULL_not_found("Brian"))
\ No newline at end of file
+
+def _classify_array(column: "np.ndarray") -> "np.ndarray":
+    """
+    Classify a NumPy array with one vectorized check for its dtype.
+
+    Typed columns follow their dtype kind: NaN is Cheese in any float
+    column, 0 is Zero in any integer column.
+
+    Args:
+        column (np.ndarray): The values, of any shape.
+
+    Returns:
+        np.ndarray: int8 category codes, with the shape of column.
+    """
+    kind = column.dtype.kind
+    if kind == "O":
+        codes = np.fromiter(map(null_code, column.ravel()), dtype=np.int8,
+                            count=column.size)
+        return codes.reshape(column.shape)
+    codes = np.full(column.shape, OTHER, dtype=np.int8)
+    if kind == "f":
+        codes[np.isnan(column)] = CHEESE
+    elif kind in "iu":
+        codes[column == 0] = ZERO
+    elif kind == "U":
+        codes[column == ""] = EMPTY
+    elif kind == "b":
+        codes[~column] = FAKE
+    return codes
+
+
+def classify_nulls(column: Any) -> Tuple[Any, List[int]]:
+    """
+    Classify every value of a column like NULL_not_found, without printing.
+
+    NumPy arrays are checked with vectorized masks (np.isnan, == 0, == "");
+    lists and object arrays are classified value by value through the
+    type-dispatch table.
+
+    Args:
+        column (Any): A list or other iterable of values, or a NumPy array.
+
+    Returns:
+        Tuple[Any, List[int]]: The category code of each value (an int8
+        NumPy array, or a list when NumPy is not installed), and the number
+        of values in each of the CATEGORIES.
+    """
+    if np is None:
+        codes = [null_code(value) for value in column]
+        counts = [0] * len(CATEGORIES)
+        for code in codes:
+            counts[code] += 1
+        return codes, counts
+    if isinstance(column, np.ndarray):
+        codes = _classify_array(column)
+    else:
+        codes = np.fromiter(map(null_code, column), dtype=np.int8)
+    counts = np.bincount(codes.ravel(), minlength=len(CATEGORIES))
+    return codes, counts.tolist()
+
+
+def main():
+    Nothing = None
+    Garlic = float("NaN")
+    Zero = 0
+    Empty = ''
+    Fake = False
+
+    NULL_not_found(Nothing)
+    NULL_not_found(Garlic)
+    NULL_not_found(Zero)
+    NULL_not_found(Empty)
+    NULL_not_found(Fake)
+    print(NULL_not_found("Brian"))
+
+
+if __name__ == "__main__":
+    main()
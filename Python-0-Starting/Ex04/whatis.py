@@ -1,20 +1,286 @@
 import sys
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, integers then go through int()
+    np = None
+
+# Number of bytes read per chunk in bulk mode (a multiple of 8).
+BLOCK_SIZE = 1 << 20
+
+# Bytes str.split() treats as whitespace in ASCII text.
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+# Maps the separators bytes.split() misses (\x1c-\x1f) to spaces, so that
+# both paths split integers on _ASCII_WHITESPACE.
+_TO_SPACE = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+
+USAGE = "usage: whatis.py --bulk [--binary] [--mask PATH] [path ...]"
+
 
 def whatis(arg):
-   if len(sys.argv) != 2:
-       raise AssertionError("AssertionError: more than one argument is provided")
+    if len(sys.argv) != 2:
+        raise AssertionError(
+            "AssertionError: more than one argument is provided")
 
-   try:
-       num = int(arg)
-       print("I'm Even." if num % 2 == 0 else "I'm Odd.")
-   except ValueError:
-       raise AssertionError("AssertionError: argument is not an integer")
+    try:
+        num = int(arg)
+        print("I'm Even." if num % 2 == 0 else "I'm Odd.")
+    except ValueError:
+        raise AssertionError("AssertionError: argument is not an integer")
 
-try:
-   if(len(sys.argv) >= 2):
-       whatis(sys.argv[1])
-   elif(len(sys.argv) < 2):
-       sys.exit(1)
-except AssertionError as e:
-   print(e)
-   sys.exit(1)
\ No newline at end of file
+
+def parity_tokens(block: bytes) -> List[int]:
+    """
+    Return the parity of each whitespace-separated integer, with int().
+
+    Python integers have arbitrary precision, so this is the fallback for
+    whatever text parity_text cannot handle. Integers are separated by the
+    same bytes as in parity_text, those of _ASCII_WHITESPACE.
+
+    Args:
+        block (bytes): Complete integers separated by whitespace.
+
+    Returns:
+        List[int]: 1 for each odd integer, 0 for each even one.
+
+    Raises:
+        AssertionError: If a token is not an integer.
+    """
+    try:
+        return [int(token) & 1
+                for token in block.translate(_TO_SPACE).split()]
+    except ValueError:
+        raise AssertionError("AssertionError: argument is not an integer")
+
+
+def parity_text(block: bytes) -> "np.ndarray":
+    """
+    Return the parity of each whitespace-separated decimal integer.
+
+    The parity of a decimal number is the parity of its last digit, and
+    the ASCII code of a digit has the digit's parity, so the flags are the
+    last byte of every token & 1: no number is ever parsed, whatever its
+    size. All the ASCII whitespace bytes are below 33, so tokens are the
+    runs of bytes above 32, found with comparisons only. Blocks holding
+    anything but optionally signed ASCII digits go through parity_tokens.
+
+    Args:
+        block (bytes): Complete integers separated by whitespace.
+
+    Returns:
+        np.ndarray: uint8 flags, 1 for each odd integer.
+
+    Raises:
+        AssertionError: If a token is not an integer.
+    """
+    data = np.frombuffer(b" " + block + b" ", dtype=np.uint8)
+    in_token = data > 32
+
+    # Bytes below 33 must be whitespace, and bytes above 32 digits but for
+    # a sign between whitespace and a digit
+    control = (data < 9) | ((data > 13) & (data < 28))
+    not_digit = np.flatnonzero(in_token & ((data < 48) | (data > 57)))
+    after = data[not_digit + 1]
+    if control.any() or not (
+            np.all((data[not_digit] == 43) | (data[not_digit] == 45))
+            and np.all(data[not_digit - 1] < 33)
+            and np.all((after >= 48) & (after <= 57))):
+        return np.array(parity_tokens(block), dtype=np.uint8)
+    ends = np.flatnonzero(in_token[:-1] & ~in_token[1:])
+    return data[ends] & 1
+
+
+def parity_binary(block: bytes) -> "np.ndarray":
+    """
+    Return the parity of each little-endian int64 of a block.
+
+    Args:
+        block (bytes): Raw int64 values, a multiple of 8 bytes.
+
+    Returns:
+        np.ndarray: uint8 flags, 1 for each odd integer.
+    """
+    return (np.frombuffer(block, dtype="<i8") & 1).astype(np.uint8)
+
+
+def _split_block(chunk: bytes, binary: bool) -> Tuple[bytes, bytes]:
+    """Split a chunk into its complete integers and the partial one left."""
+    if binary:
+        end = len(chunk) - len(chunk) % 8
+    else:
+        end = max(chunk.rfind(bytes([space])) for space in _ASCII_WHITESPACE)
+        end += 1
+    return chunk[:end], chunk[end:]
+
+
+def parity_stream(stream: BinaryIO, binary: bool = False,
+                  block_size: int = BLOCK_SIZE) -> Iterator:
+    """
+    Read integers from a stream in chunks and yield their parities.
+
+    Text streams hold decimal integers separated by whitespace, of any
+    size; binary streams hold raw little-endian int64 values. An integer cut
+    by the end of a chunk is carried over to the next one, so memory use
+    does not depend on the stream size.
+
+    Args:
+        stream (BinaryIO): Binary stream to read the integers from.
+        binary (bool): Whether the integers are raw int64 values.
+        block_size (int): Number of bytes read per chunk.
+
+    Yields:
+        The parity flags of each chunk, 1 for odd integers: a uint8 NumPy
+        array, or a list when NumPy is not installed.
+
+    Raises:
+        AssertionError: If the stream holds something else than integers.
+    """
+    rest = b""
+    while True:
+        chunk = stream.read(block_size)
+        if not chunk:
+            break
+        block, rest = _split_block(rest + chunk, binary)
+        if block:
+            yield _parities(block, binary)
+    if rest and binary:
+        raise AssertionError(
+            "AssertionError: input is not a whole number of int64 values")
+    if rest:
+        yield _parities(rest, binary)
+
+
+def _parities(block: bytes, binary: bool):
+    """Return the parity flags of a block of complete integers."""
+    if np is not None:
+        return parity_binary(block) if binary else parity_text(block)
+    if binary:
+        # The first byte of a little-endian value is its lowest one
+        return [byte & 1 for byte in block[::8]]
+    return parity_tokens(block)
+
+
+class MaskWriter:
+    """
+    Write parity flags as a bitmask, 8 flags per byte, most significant bit
+    first (as np.packbits); the last byte is padded with zeros.
+    """
+
+    def __init__(self, output: BinaryIO) -> None:
+        self.output = output
+        self.pending: List[int] = []
+
+    def write(self, flags) -> None:
+        """Append flags to the mask, writing every complete byte."""
+        if np is not None:
+            bits = np.concatenate((np.array(self.pending, dtype=np.uint8),
+                                   flags))
+            whole = len(bits) - len(bits) % 8
+            self.output.write(np.packbits(bits[:whole]).tobytes())
+            self.pending = bits[whole:].tolist()
+            return
+        bits = self.pending + list(flags)
+        whole = len(bits) - len(bits) % 8
+        self.output.write(self._pack(bits[:whole]))
+        self.pending = bits[whole:]
+
+    def close(self) -> None:
+        """Write the last, zero-padded byte."""
+        if self.pending:
+            self.output.write(self._pack(self.pending))
+            self.pending = []
+
+    @staticmethod
+    def _pack(bits: List[int]) -> bytes:
+        return bytes(
+            sum(bit << (7 - shift) for shift, bit in enumerate(bits[i:i + 8]))
+            for i in range(0, len(bits), 8)
+        )
+
+
+def count_parity(paths: List[str], binary: bool = False,
+                 mask: Optional[BinaryIO] = None) -> Tuple[int, int]:
+    """
+    Count the even and odd integers of files, "-" meaning stdin.
+
+    Args:
+        paths (List[str]): Paths of the files to read, in order.
+        binary (bool): Whether the files hold raw little-endian int64.
+        mask (Optional[BinaryIO]): Stream the parity bitmask of all the
+            integers is written to, 1 for odd, if given.
+
+    Returns:
+        Tuple[int, int]: The number of even and of odd integers.
+    """
+    writer = MaskWriter(mask) if mask is not None else None
+    total = odd = 0
+    for path in paths:
+        stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            for flags in parity_stream(stream, binary):
+                total += len(flags)
+                odd += int(flags.sum()) if np is not None else sum(flags)
+                if writer is not None:
+                    writer.write(flags)
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+    if writer is not None:
+        writer.close()
+    return total - odd, odd
+
+
+def bulk(args: List[str]) -> None:
+    """
+    Run the bulk mode: --bulk [--binary] [--mask PATH] [path ...].
+
+    Args:
+        args (List[str]): Command-line arguments after --bulk.
+
+    Raises:
+        AssertionError: If the arguments are bad.
+    """
+    binary = "--binary" in args
+    args = [arg for arg in args if arg != "--binary"]
+    mask_path = None
+    if "--mask" in args:
+        index = args.index("--mask")
+        if index + 1 >= len(args):
+            raise AssertionError(f"AssertionError: {USAGE}")
+        mask_path = args.pop(index + 1)
+        args.pop(index)
+    paths = args or ["-"]
+    if mask_path is None:
+        even, odd = count_parity(paths, binary)
+    else:
+        with open(mask_path, "wb") as mask:
+            even, odd = count_parity(paths, binary, mask)
+    print(f"Even: {even}")
+    print(f"Odd: {odd}")
+
+
+def main():
+    """
+    Print whether the argument is even or odd.
+
+    With --bulk, the integers of files (or stdin) are counted instead.
+    """
+    try:
+        if len(sys.argv) >= 2 and sys.argv[1] == "--bulk":
+            bulk(sys.argv[2:])
+        elif len(sys.argv) >= 2:
+            whatis(sys.argv[1])
+        elif len(sys.argv) < 2:
+            sys.exit(1)
+    except AssertionError as e:
+        print(e)
+        sys.exit(1)
+    except OSError as e:
+        print(e)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,149 @@ A Python script that counts the number of uppercase letters, lowercase letters,
 
 Usage:
     python building.py [text]
+    python building.py --files [path ...]
 
 Arguments:
     text (str, optional): The text to analyze. If not provided, the user will be prompted to enter the text.
+    --files, -f: Stream the given files (or stdin when no path or "-" is
+        given) in fixed-size chunks instead of reading a single text.
+        Several files are counted in parallel and the counts merged.
 
 Raises:
     AssertionError: If more than one argument is provided.
 """
 
+import codecs
+import os
+import string
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, List, NamedTuple, Optional
+
+# Size of the binary chunks read by the streaming mode.
+CHUNK_SIZE = 1 << 20
+
+# Class codes written by the ASCII translate table (one byte per input char).
+_OTHER, _UPPER, _LOWER, _PUNCT, _DIGIT, _SPACE = range(6)
+
+_ASCII_CLASSES = bytes(
+    _UPPER if chr(code) in string.ascii_uppercase
+    else _LOWER if chr(code) in string.ascii_lowercase
+    else _PUNCT if chr(code) in string.punctuation
+    else _DIGIT if chr(code) in string.digits
+    else _SPACE if chr(code).isspace()
+    else _OTHER
+    for code in range(256)
+)
+
+# Deletes every ASCII code point, leaving only the characters that need the
+# Unicode-aware slow path.
+_DROP_ASCII = dict.fromkeys(range(128))
+
+_PUNCTUATION = frozenset(string.punctuation)
+
+
+class CharacterCounts(NamedTuple):
+    """
+    Character class counts for a piece of text.
+
+    Attributes:
+        total (int): Number of characters.
+        upper (int): Number of uppercase letters.
+        lower (int): Number of lowercase letters.
+        punctuation (int): Number of ASCII punctuation marks.
+        spaces (int): Number of whitespace characters.
+        digits (int): Number of digits.
+    """
+    total: int = 0
+    upper: int = 0
+    lower: int = 0
+    punctuation: int = 0
+    spaces: int = 0
+    digits: int = 0
+
+    def merge(self, other: "CharacterCounts") -> "CharacterCounts":
+        """
+        Combine the counts of two pieces of text.
+
+        Args:
+            other (CharacterCounts): The counts to add to these ones.
+
+        Returns:
+            CharacterCounts: The field-wise sum of both counts.
+        """
+        return CharacterCounts(*(a + b for a, b in zip(self, other)))
+
+
+def _classify_unicode(text):
+    """
+    Classify characters one by one with the Unicode-aware str predicates.
+
+    Args:
+        text (str): The characters to classify (expected to be non-ASCII).
+
+    Returns:
+        CharacterCounts: The counts for the given characters.
+    """
+    upper = lower = punct = digit = space = 0
+    for char in text:
+        if char.isupper():
+            upper += 1
+        if char.islower():
+            lower += 1
+        if char in _PUNCTUATION:
+            punct += 1
+        if char.isdigit():
+            digit += 1
+        if char.isspace():
+            space += 1
+    return CharacterCounts(len(text), upper, lower, punct, space, digit)
+
+
+def classify_characters(text):
+    """
+    Count the character classes of a text in a single table-driven pass.
+
+    The ASCII part of the text is mapped to one class byte per character with
+    bytes.translate, and every class is then counted with bytes.count, so the
+    whole scan runs in C. Non-ASCII characters are extracted and classified
+    with the regular str predicates.
+
+    Args:
+        text (str): The text to analyze.
+
+    Returns:
+        CharacterCounts: The counts for the text.
+    """
+    ascii_bytes = text.encode("ascii", "ignore")
+    classes = ascii_bytes.translate(_ASCII_CLASSES)
+    counts = CharacterCounts(
+        len(ascii_bytes),
+        classes.count(_UPPER),
+        classes.count(_LOWER),
+        classes.count(_PUNCT),
+        classes.count(_SPACE),
+        classes.count(_DIGIT),
+    )
+    if len(ascii_bytes) != len(text):
+        counts = counts.merge(_classify_unicode(text.translate(_DROP_ASCII)))
+    return counts
+
+
+def print_counts(counts):
+    """
+    Print character class counts in the exercise's report format.
+
+    Args:
+        counts (CharacterCounts): The counts to report.
+    """
+    print(f"The text contains {counts.total} characters:")
+    print(f"{counts.upper} upper letters")
+    print(f"{counts.lower} lower letters")
+    print(f"{counts.punctuation} punctuation marks")
+    print(f"{counts.spaces} spaces")
+    print(f"{counts.digits} digits")
+
 
 def count_characters(text):
     """
@@ -21,21 +155,92 @@ def count_characters(text):
         text (str): The text to analyze.
 
     Returns:
-        None. The results are printed to the console.
-    """
-    upper_count = sum(1 for char in text if char.isupper())
-    lower_count = sum(1 for char in text if char.islower())
-    punct_count = sum(1 for char in text if char in '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~')
-    digit_count = sum(1 for char in text if char.isdigit())
-    space_count = sum(1 for char in text if char.isspace())
-    total_count = len(text)
-
-    print(f"The text contains {total_count} characters:")
-    print(f"{upper_count} upper letters")
-    print(f"{lower_count} lower letters")
-    print(f"{punct_count} punctuation marks")
-    print(f"{space_count} spaces")
-    print(f"{digit_count} digits")
+        CharacterCounts: The counts, which are also printed to the console.
+    """
+    counts = classify_characters(text)
+    print_counts(counts)
+    return counts
+
+
+def count_stream(stream: BinaryIO, chunk_size: int = CHUNK_SIZE,
+                 errors: str = "strict") -> CharacterCounts:
+    """
+    Count the character classes of a binary UTF-8 stream chunk by chunk.
+
+    The stream is read in fixed-size binary chunks and decoded with an
+    incremental UTF-8 decoder, so multi-byte characters split across two
+    chunks are handled and memory use does not depend on the stream size.
+
+    Args:
+        stream (BinaryIO): The binary stream to read.
+        chunk_size (int): Number of bytes read per chunk.
+        errors (str): Error handler passed to the UTF-8 decoder.
+
+    Returns:
+        CharacterCounts: The counts for the whole stream.
+
+    Raises:
+        UnicodeDecodeError: If the stream is not valid UTF-8 and errors is
+            "strict".
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors)
+    counts = CharacterCounts()
+    while True:
+        chunk = stream.read(chunk_size)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            counts = counts.merge(classify_characters(text))
+        if not chunk:
+            return counts
+
+
+def count_file(path: str, chunk_size: int = CHUNK_SIZE) -> CharacterCounts:
+    """
+    Count the character classes of a UTF-8 file, "-" meaning stdin.
+
+    Args:
+        path (str): Path of the file to read.
+        chunk_size (int): Number of bytes read per chunk.
+
+    Returns:
+        CharacterCounts: The counts for the file.
+    """
+    if path == "-":
+        return count_stream(sys.stdin.buffer, chunk_size)
+    with open(path, "rb") as stream:
+        return count_stream(stream, chunk_size)
+
+
+def count_files(paths: List[str],
+                workers: Optional[int] = None) -> CharacterCounts:
+    """
+    Count the character classes of several files and merge the results.
+
+    Regular files are streamed in a process pool, one file per task; stdin
+    ("-") is always read by the calling process.
+
+    Args:
+        paths (List[str]): Paths of the files to read.
+        workers (Optional[int]): Size of the process pool. Defaults to the
+            number of CPUs, capped by the number of files.
+
+    Returns:
+        CharacterCounts: The merged counts of every file.
+    """
+    counts = CharacterCounts()
+    files = [path for path in paths if path != "-"]
+    if len(files) != len(paths):
+        counts = count_file("-")
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        results = map(count_file, files)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(count_file, files))
+    for result in results:
+        counts = counts.merge(result)
+    return counts
+
 
 def main():
     """
@@ -44,18 +249,23 @@ def main():
     Checks if the script was called with more than one argument, and raises an AssertionError if that's the case.
     If no argument was provided, it prompts the user to enter the text to be analyzed.
     If an argument was provided, it uses that as the input text.
-    Finally, it calls the count_characters function with the input text.
+    With --files, the given files (or stdin) are streamed and their merged
+    counts are printed.
     """
-    assert len(sys.argv) <= 2, "AssertionError"
+    args = sys.argv[1:]
+
+    if args and args[0] in ("--files", "-f"):
+        print_counts(count_files(args[1:] or ["-"]))
+        return
+
+    assert len(args) <= 1, "Too many arguments"
 
-    if len(sys.argv) == 1:
+    if not args:
         text = input("What is the text to count?\n") + "\r"
-    elif len(sys.argv) >= 2:
-        raise AssertionError("Too many arguments")
     else:
-        text = sys.argv[1]
+        text = args[0]
 
     count_characters(text)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
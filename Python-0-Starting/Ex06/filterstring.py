@@ -1,6 +1,19 @@
 import sys
+from typing import BinaryIO, List
+
 from ft_filter import ft_filter
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, streams then use filter_words
+    np = None
+
+# Approximate number of bytes of complete lines read per block in file mode.
+BLOCK_SIZE = 1 << 20
+
+# Bytes str.split() treats as whitespace in ASCII text.
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
 
 def validate_arguments(args):
     """
@@ -42,12 +55,117 @@ def filter_words(sentence: str, length: int) -> list:
     return list(ft_filter(lambda word: len(word) > length, words))
 
 
+def filter_block(block: bytes, length: int) -> bytes:
+    """
+    Filter the words of an ASCII block that are longer than length, using
+    vectorized token offsets instead of a Python call per word.
+
+    Whitespace bytes are flagged through a lookup table, word starts and ends
+    are the rising and falling edges of the non-whitespace mask, and word
+    lengths are the differences of those offset arrays. The kept words are
+    gathered with a single boolean mask, the byte following each of them
+    being replaced by a newline.
+
+    Args:
+        block (bytes): ASCII text made of complete lines.
+        length (int): Minimum length of words to keep.
+
+    Returns:
+        bytes: Words longer than the specified length, one per line.
+    """
+    is_space = np.zeros(256, dtype=bool)
+    is_space[np.frombuffer(_ASCII_WHITESPACE, dtype=np.uint8)] = True
+    data = np.frombuffer(block + b"\n", dtype=np.uint8).copy()
+    in_word = ~is_space[data]
+
+    edges = np.diff(in_word.astype(np.int8), prepend=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) > length
+    starts, ends = starts[keep], ends[keep]
+
+    # +1 where a kept word starts, -1 right after its trailing separator
+    bounds = np.zeros(len(data) + 1, dtype=np.int8)
+    bounds[starts] += 1
+    bounds[ends + 1] -= 1
+    data[ends] = ord("\n")
+    return data[np.cumsum(bounds[:-1], dtype=np.int8) > 0].tobytes()
+
+
+def filter_stream(stream: BinaryIO, length: int, output: BinaryIO,
+                  block_size: int = BLOCK_SIZE) -> int:
+    """
+    Filter the words longer than length from a UTF-8 stream, line by line.
+
+    Complete lines are read in blocks of about block_size bytes and the
+    matching words are written to output, one per line, as soon as each block
+    is processed, so memory use does not depend on the stream size. ASCII
+    blocks take the vectorized path when NumPy is available; other blocks are
+    decoded and go through filter_words.
+
+    Args:
+        stream (BinaryIO): Binary stream to read the text from.
+        length (int): Minimum length of words to keep.
+        output (BinaryIO): Binary stream the matching words are written to.
+        block_size (int): Approximate number of bytes read per block.
+
+    Returns:
+        int: Number of words written.
+    """
+    written = 0
+    while True:
+        lines = stream.readlines(block_size)
+        if not lines:
+            return written
+        block = b"".join(lines)
+        if np is not None and block.isascii():
+            matches = filter_block(block, length)
+        else:
+            matches = "".join(
+                word + "\n"
+                for word in filter_words(block.decode("utf-8"), length)
+            ).encode("utf-8")
+        if matches:
+            output.write(matches)
+            written += matches.count(b"\n")
+
+
+def filter_files(paths: List[str], length: int, output: BinaryIO) -> int:
+    """
+    Filter the words longer than length from files, "-" meaning stdin.
+
+    Args:
+        paths (List[str]): Paths of the files to read, in order.
+        length (int): Minimum length of words to keep.
+        output (BinaryIO): Binary stream the matching words are written to.
+
+    Returns:
+        int: Number of words written.
+    """
+    written = 0
+    for path in paths:
+        if path == "-":
+            written += filter_stream(sys.stdin.buffer, length, output)
+            continue
+        with open(path, "rb") as stream:
+            written += filter_stream(stream, length, output)
+    return written
+
+
 def main():
     """
     Main function to handle command-line arguments and filter words.
     Validates arguments, filters words, and prints the result.
+
+    With --files LENGTH [path ...], the files (or stdin) are streamed and
+    matching words are written one per line instead.
     """
     try:
+        if len(sys.argv) >= 3 and sys.argv[1] in ("--files", "-f"):
+            validate_arguments(sys.argv[:3])
+            filter_files(sys.argv[3:] or ["-"], int(sys.argv[2]),
+                         sys.stdout.buffer)
+            return
         validate_arguments(sys.argv)
         sentence = sys.argv[1]
         length = int(sys.argv[2])
@@ -1,14 +1,105 @@
-import sys
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 
 
-def ft_filter(function, iterable):
+class ft_filter:
     """filter(function or None, iterable) --> filter object
 
 Return an iterator yielding those items of iterable for which function(item)
 is true. If function is None, return the items that are true."""
-    if function is None:
-        return [x for x in iterable if bool(x)]
-    return [x for x in iterable if function(x)]
+
+    __slots__ = ("_function", "_iterator")
+
+    def __init__(self, function, iterable):
+        self._function = function
+        self._iterator = iter(iterable)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """Return the next item of the iterable accepted by the function."""
+        function = self._function
+        if function is None or function is bool:
+            # Fast path: plain truth test, no call per item
+            for item in self._iterator:
+                if item:
+                    return item
+        else:
+            for item in self._iterator:
+                if function(item):
+                    return item
+        raise StopIteration
+
+    def __reduce__(self):
+        """Pickle as the function plus the remaining underlying iterator."""
+        return type(self), (self._function, self._iterator)
+
+
+def _filter_chunk(function, chunk):
+    """
+    Filter one chunk of items in a worker.
+
+    Args:
+        function (callable or None): Predicate, None meaning truthiness.
+        chunk (list): Items to filter.
+
+    Returns:
+        list: The items of chunk accepted by the predicate, in order.
+    """
+    return list(ft_filter(function, chunk))
+
+
+def ft_parallel_filter(function, iterable, chunksize=1024, workers=None,
+                       threads=False, lookahead=None):
+    """
+    Filter an iterable with a pool of workers, yielding items in order.
+
+    The input is cut into chunks of chunksize items, each chunk is filtered
+    by a worker, and results are yielded in the original order. At most
+    lookahead chunks are in flight at once, so an infinite or huge input is
+    never read far ahead of the consumer.
+
+    Use processes (the default) for CPU-bound predicates; the predicate and
+    the items must then be picklable. Use threads=True for I/O-bound
+    predicates that release the GIL.
+
+    Args:
+        function (callable or None): Predicate, None meaning truthiness.
+        iterable (iterable): Items to filter.
+        chunksize (int): Number of items sent to a worker per task.
+        workers (int, optional): Pool size, defaults to the CPU count.
+        threads (bool): Use a thread pool instead of a process pool.
+        lookahead (int, optional): Maximum number of chunks in flight,
+            defaults to twice the number of workers.
+
+    Yields:
+        The items of iterable for which function(item) is true.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    lookahead = lookahead or 2 * workers
+    executor_type = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    iterator = iter(iterable)
+    pending = deque()
+    with executor_type(max_workers=workers) as executor:
+        try:
+            while True:
+                chunk = list(islice(iterator, chunksize))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_filter_chunk, function, chunk))
+                if len(pending) >= lookahead:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Consumer stopped early: drop the chunks nobody will read
+            for future in pending:
+                future.cancel()
 
 
 def main() -> None:
@@ -20,19 +111,19 @@ def main() -> None:
         # Example 1: Filter with a lambda function
         numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
         even_numbers = ft_filter(lambda x: x % 2 == 0, numbers)
-        print("Even numbers:", even_numbers)
+        print("Even numbers:", list(even_numbers))
 
         # Example 2: Filter with None
         mixed_list = [0, 1, False, True, '', 'hello', None, 42]
         truthy_values = ft_filter(None, mixed_list)
-        print("Truthy values:", truthy_values)
+        print("Truthy values:", list(truthy_values))
 
         # Example 3: Filter with a custom function
         def is_positive(x):
             return x > 0
 
         positive_numbers = ft_filter(is_positive, [-1, 0, 1, 2, -3, 4])
-        print("Positive numbers:", positive_numbers)
+        print("Positive numbers:", list(positive_numbers))
 
     except Exception as e:
         print(f"An error occurred: {e}")
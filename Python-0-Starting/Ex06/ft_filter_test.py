@@ -1,7 +1,23 @@
+import itertools
+import pickle
 import sys
+import time
+import tracemalloc
 import ft_filter
 
 
+def print_test_header(test_name):
+    """
+    Print a formatted header for each test case.
+
+    Args:
+        test_name (str): Name of the current test scenario
+    """
+    print(f"\n{'=' * 50}")
+    print(f"TEST: {test_name}")
+    print(f"{'=' * 50}")
+
+
 def test_filter_comparison():
     """
     Compare the behavior and documentation of built-in filter()
@@ -10,17 +26,6 @@ def test_filter_comparison():
     Prints detailed comparison of filter results and docstrings
     to help verify functional and documentation equivalence.
     """
-    def print_test_header(test_name):
-        """
-        Print a formatted header for each test case.
-
-        Args:
-            test_name (str): Name of the current test scenario
-        """
-        print(f"\n{'=' * 50}")
-        print(f"TEST: {test_name}")
-        print(f"{'=' * 50}")
-
     # Compare Docstrings
     print_test_header("DOCSTRING COMPARISON")
     builtin_filter_doc = filter.__doc__
@@ -40,7 +45,7 @@ def test_filter_comparison():
     numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
     builtin_even = list(filter(lambda x: x % 2 == 0, numbers))
-    custom_even = ft_filter.ft_filter(lambda x: x % 2 == 0, numbers)
+    custom_even = list(ft_filter.ft_filter(lambda x: x % 2 == 0, numbers))
 
     print("Built-in filter even numbers:", builtin_even)
     print("Custom ft_filter even numbers:", custom_even)
@@ -51,7 +56,7 @@ def test_filter_comparison():
     mixed_list = [0, 1, False, True, '', 'hello', None, 42]
 
     builtin_truthy = list(filter(None, mixed_list))
-    custom_truthy = ft_filter.ft_filter(None, mixed_list)
+    custom_truthy = list(ft_filter.ft_filter(None, mixed_list))
 
     print("Built-in filter truthy values:", builtin_truthy)
     print("Custom ft_filter truthy values:", custom_truthy)
@@ -65,18 +70,20 @@ def test_filter_comparison():
     numbers_with_negatives = [-1, 0, 1, 2, -3, 4]
 
     builtin_positive = list(filter(is_positive, numbers_with_negatives))
-    custom_positive = ft_filter.ft_filter(is_positive, numbers_with_negatives)
+    custom_positive = list(
+        ft_filter.ft_filter(is_positive, numbers_with_negatives))
 
     print("Built-in filter positive numbers:", builtin_positive)
     print("Custom ft_filter positive numbers:", custom_positive)
-    assert builtin_positive == custom_positive, "Positive number filtering failed"
+    assert builtin_positive == custom_positive, \
+        "Positive number filtering failed"
 
     # Test Case 4: Empty list
     print_test_header("Empty List Filtering")
     empty_list = []
 
     builtin_empty = list(filter(lambda x: x > 0, empty_list))
-    custom_empty = ft_filter.ft_filter(lambda x: x > 0, empty_list)
+    custom_empty = list(ft_filter.ft_filter(lambda x: x > 0, empty_list))
 
     print("Built-in filter empty list:", builtin_empty)
     print("Custom ft_filter empty list:", custom_empty)
@@ -85,14 +92,184 @@ def test_filter_comparison():
     print("\n✅ All filter comparisons and docstring checks passed successfully!")
 
 
+def test_lazy_iterator():
+    """
+    Check that ft_filter behaves like the builtin filter object: it is its
+    own iterator, consumes the input lazily (so infinite streams work) and
+    can be pickled mid-iteration.
+    """
+    print_test_header("Lazy Iterator Semantics")
+    result = ft_filter.ft_filter(None, [0, 1, 2])
+    assert iter(result) is result, "ft_filter must be its own iterator"
+    assert next(result) == 1 and next(result) == 2, "Wrong items yielded"
+    assert next(result, "done") == "done", "Iterator must be exhausted"
+
+    # Short-circuits on an infinite stream
+    multiples = ft_filter.ft_filter(lambda x: x % 7 == 0, itertools.count(1))
+    first = list(itertools.islice(multiples, 3))
+    print("First multiples of 7 on an infinite stream:", first)
+    assert first == [7, 14, 21], "Infinite stream filtering failed"
+
+    # Pickle round trip keeps the iteration state
+    partial = ft_filter.ft_filter(None, [0, 1, 0, 2, 3])
+    next(partial)
+    restored = pickle.loads(pickle.dumps(partial))
+    assert list(restored) == [2, 3], "Pickled iterator lost its position"
+    print("Pickled iterator resumes at:", [2, 3])
+
+
+def measure_stream(filter_type, function, size):
+    """
+    Measure the time to the first item and the peak memory of a filter
+    built over a generator of size items.
+
+    Args:
+        filter_type (type): filter or ft_filter.ft_filter.
+        function (callable or None): Predicate given to the filter.
+        size (int): Number of items in the stream.
+
+    Returns:
+        tuple: (time to first item in seconds, peak memory in bytes)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    filtered = filter_type(function, (x for x in range(size)))
+    next(filtered)
+    first_item = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_item, peak
+
+
+def test_stream_benchmark():
+    """
+    Benchmark time-to-first-item and peak memory of ft_filter against the
+    builtin filter on a large stream. Both must be lazy, so neither should
+    depend on the stream size.
+    """
+    print_test_header("Large Stream Benchmark")
+    size = 10_000_000
+    for function in (None, lambda x: x % 2 == 1):
+        builtin_first, builtin_peak = measure_stream(filter, function, size)
+        custom_first, custom_peak = measure_stream(
+            ft_filter.ft_filter, function, size)
+        label = "None" if function is None else "lambda"
+        print(f"[{label}] builtin filter: first item {builtin_first:.6f}s, "
+              f"peak {builtin_peak} B")
+        print(f"[{label}] ft_filter:      first item {custom_first:.6f}s, "
+              f"peak {custom_peak} B")
+        assert custom_peak < 64 * 1024, "ft_filter buffers the stream"
+
+    # Laziness is checked by counting the items pulled from the stream,
+    # not by timing, which depends on the machine load
+    consumed = []
+
+    def stream():
+        for x in range(size):
+            consumed.append(x)
+            yield x
+
+    filtered = ft_filter.ft_filter(lambda x: x % 2 == 1, stream())
+    assert consumed == [], "ft_filter reads the stream before next()"
+    assert next(filtered) == 1
+    assert consumed == [0, 1], "ft_filter reads ahead of the first item"
+
+
+def is_prime(n):
+    """
+    Deliberately slow trial-division primality test used as a CPU-heavy
+    predicate. Defined at module level so process pools can pickle it.
+
+    Args:
+        n (int): Number to test.
+
+    Returns:
+        bool: True if n is prime.
+    """
+    if n < 2:
+        return False
+    return all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+
+def test_parallel_filter():
+    """
+    Check that ft_parallel_filter matches the builtin filter, keeps the
+    input order with processes and threads, and stops early on infinite
+    streams thanks to its bounded lookahead.
+    """
+    print_test_header("Parallel Filter")
+    numbers = range(5000)
+    expected = list(filter(is_prime, numbers))
+    for threads in (False, True):
+        result = list(ft_filter.ft_parallel_filter(
+            is_prime, numbers, chunksize=97, workers=2, threads=threads))
+        assert result == expected, "Parallel filtering lost or reordered items"
+
+    mixed_list = [0, 1, False, True, '', 'hello', None, 42]
+    assert list(ft_filter.ft_parallel_filter(
+        None, mixed_list, chunksize=3, workers=2, threads=True)) \
+        == list(filter(None, mixed_list)), "None predicate failed"
+
+    stream = ft_filter.ft_parallel_filter(
+        is_prime, itertools.count(), chunksize=64, workers=2)
+    first = list(itertools.islice(stream, 5))
+    stream.close()
+    print("First primes of an infinite stream:", first)
+    assert first == [2, 3, 5, 7, 11], "Infinite stream filtering failed"
+
+
+def benchmark_parallel_filter():
+    """
+    Print how ft_parallel_filter scales with the number of workers and where
+    the chunk size stops being dominated by inter-process overhead, using a
+    CPU-heavy predicate against the serial ft_filter.
+    """
+    print_test_header("Parallel Filter Benchmark")
+    numbers = range(10 ** 8, 10 ** 8 + 20_000)
+
+    start = time.perf_counter()
+    expected = list(ft_filter.ft_filter(is_prime, numbers))
+    serial = time.perf_counter() - start
+    print(f"serial ft_filter: {serial:.3f}s")
+
+    print("\nScaling across workers (chunksize=256):")
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        result = list(ft_filter.ft_parallel_filter(
+            is_prime, numbers, chunksize=256, workers=workers))
+        elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"  workers={workers}: {elapsed:.3f}s "
+              f"(speed-up x{serial / elapsed:.2f})")
+
+    print("\nChunk size crossover (cheap predicate, workers=4):")
+    cheap = range(200_000)
+    start = time.perf_counter()
+    list(ft_filter.ft_filter(None, cheap))
+    print(f"  serial ft_filter: {time.perf_counter() - start:.3f}s")
+    for chunksize in (16, 256, 4096, 65536):
+        start = time.perf_counter()
+        list(ft_filter.ft_parallel_filter(
+            None, cheap, chunksize=chunksize, workers=4))
+        print(f"  chunksize={chunksize}: {time.perf_counter() - start:.3f}s")
+
+
 def main() -> None:
     """
     Main function to run filter comparison tests.
 
+    The parallel filter benchmark spins up process pools over expensive
+    predicates, so it only runs when --benchmark is given.
+
     Handles any potential exceptions during testing.
     """
     try:
         test_filter_comparison()
+        test_lazy_iterator()
+        test_stream_benchmark()
+        test_parallel_filter()
+        if "--benchmark" in sys.argv[1:]:
+            benchmark_parallel_filter()
     except AssertionError as ae:
         print(f"Assertion failed: {ae}")
     except Exception as e:
@@ -0,0 +1,154 @@
+"""
+morse_render.py
+
+Render Morse code, as produced by sos.convert_to_morse, to an on/off keying
+bitstream and to a PCM WAV tone.
+
+Timing follows the standard unit scheme: a dit is 1 unit on, a dah 3 units
+on, symbols of a character are 1 unit apart, characters 3 units and words
+7 units.
+"""
+
+import sys
+import wave
+
+import numpy as np
+from sos import convert_to_morse
+
+# Keying units written for each Morse character: the element itself followed
+# by the gap that always comes after it. " " adds 2 units to the 1-unit gap
+# left by the previous element (3 between characters) and " / " adds 2 + 2 + 2
+# (7 between words). A line break separates words too.
+_UNIT_PATTERNS = {
+    ".": "10",
+    "-": "1110",
+    " ": "00",
+    "/": "00",
+    "\n": "000000",
+}
+
+_PATTERN_WIDTH = max(len(pattern) for pattern in _UNIT_PATTERNS.values())
+
+# Row c holds the units of character c, left aligned; length -1 marks bytes
+# that are not Morse code.
+_UNIT_TABLE = np.zeros((256, _PATTERN_WIDTH), dtype=np.uint8)
+_UNIT_LENGTHS = np.full(256, -1, dtype=np.int8)
+for _char, _pattern in _UNIT_PATTERNS.items():
+    _UNIT_TABLE[ord(_char), :len(_pattern)] = [int(u) for u in _pattern]
+    _UNIT_LENGTHS[ord(_char)] = len(_pattern)
+del _char, _pattern
+
+# Number of keying units synthesized and written per WAV block.
+BLOCK_UNITS = 1 << 14
+
+# Largest data chunk a WAV header can describe (32-bit size field).
+_MAX_WAV_BYTES = 0xFFFFFFFF - 36
+
+
+def morse_to_bitstream(morse: str) -> np.ndarray:
+    """
+    Convert Morse code to its keying bitstream, one value per time unit.
+
+    Every character selects a precomputed row of units; the rows are
+    gathered and trimmed to their real lengths with array operations, so
+    there is no Python loop over the message.
+
+    Args:
+        morse (str): Morse code with "." and "-" elements, " " between
+            characters and " / " between words.
+
+    Returns:
+        np.ndarray: uint8 array, 1 where the key is down and 0 where it is
+        up, without leading or trailing silence.
+
+    Raises:
+        ValueError: If the input contains characters that are not Morse code.
+    """
+    try:
+        data = np.frombuffer(morse.encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        raise ValueError("Input is not Morse code.") from None
+
+    lengths = _UNIT_LENGTHS[data]
+    if np.any(lengths < 0):
+        raise ValueError("Input is not Morse code.")
+
+    mask = np.arange(_PATTERN_WIDTH) < lengths[:, np.newaxis]
+    bits = _UNIT_TABLE[data][mask]
+
+    keyed = np.flatnonzero(bits)
+    if not len(keyed):
+        return bits[:0]
+    return bits[keyed[0]:keyed[-1] + 1]
+
+
+def render_wav(morse: str, path: str, wpm: float = 20.0,
+               tone: float = 600.0, sample_rate: int = 8000,
+               volume: float = 0.5) -> float:
+    """
+    Render Morse code to a mono 16-bit PCM WAV file.
+
+    One unit of tone and one unit of silence are synthesized once; the
+    waveform is the bitstream used as an index into those two blocks, written
+    BLOCK_UNITS units at a time. The tone is rounded to a whole number of
+    cycles per unit, so consecutive tone units join without a phase jump and
+    every keying edge falls on a zero crossing (no clicks).
+
+    Args:
+        morse (str): Morse code to render.
+        path (str): Destination WAV file.
+        wpm (float): Speed in words per minute (PARIS timing, 1.2 / wpm
+            seconds per unit).
+        tone (float): Tone frequency in Hz.
+        sample_rate (int): Sampling rate in Hz.
+        volume (float): Amplitude between 0 and 1.
+
+    Returns:
+        float: Duration of the rendered audio in seconds.
+
+    Raises:
+        ValueError: If the parameters are out of range, the input is not
+        Morse code or the audio would exceed the 4 GiB WAV limit.
+    """
+    if wpm <= 0 or tone <= 0 or sample_rate <= 0 or not 0 <= volume <= 1:
+        raise ValueError("wpm, tone and sample_rate must be positive and "
+                         "volume between 0 and 1.")
+    bits = morse_to_bitstream(morse)
+
+    unit_samples = max(1, round(1.2 / wpm * sample_rate))
+    cycles = max(1, round(tone * unit_samples / sample_rate))
+    phase = 2 * np.pi * cycles * np.arange(unit_samples) / unit_samples
+    blocks = np.zeros((2, unit_samples), dtype="<i2")
+    blocks[1] = np.round(volume * 32767 * np.sin(phase))
+
+    if len(bits) * blocks[0].nbytes > _MAX_WAV_BYTES:
+        raise ValueError("Message too long for a single WAV file.")
+
+    with wave.open(path, "wb") as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(sample_rate)
+        for start in range(0, len(bits), BLOCK_UNITS):
+            samples = blocks[bits[start:start + BLOCK_UNITS]]
+            output.writeframes(samples.tobytes())
+
+    return len(bits) * unit_samples / sample_rate
+
+
+def main() -> None:
+    """
+    Encode the text given as first argument and render it to the WAV file
+    given as second argument.
+    """
+    try:
+        if len(sys.argv) != 3:
+            raise AssertionError("the arguments are bad")
+        duration = render_wav(convert_to_morse(sys.argv[1]), sys.argv[2])
+        print(f"{sys.argv[2]}: {duration:.2f}s of Morse code")
+    except (AssertionError, ValueError) as error:
+        print(f"{type(error).__name__}: {error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,82 @@
 """
-Program to convert a string to Morse code.
+Program to convert a string to Morse code, and Morse code back to text.
+
+Usage:
+    python sos.py <text>
+    python sos.py --encode [path ...]
+    python sos.py --decode [path ...]
+
+With --encode or --decode, the files (or stdin) are streamed in chunks and
+converted line by line.
 """
 
 import sys
+from functools import partial
+from typing import Iterable, Iterator, List
+
+# Number of characters read per chunk in streaming mode.
+CHUNK_SIZE = 1 << 16
+
+# Length of the longest Morse code ("-----").
+_MAX_CODE_LENGTH = 5
+
+
+MORSE_CODE = {
+    " ": "/",
+    "A": ".-",
+    "B": "-...",
+    "C": "-.-.",
+    "D": "-..",
+    "E": ".",
+    "F": "..-.",
+    "G": "--.",
+    "H": "....",
+    "I": "..",
+    "J": ".---",
+    "K": "-.-",
+    "L": ".-..",
+    "M": "--",
+    "N": "-.",
+    "O": "---",
+    "P": ".--.",
+    "Q": "--.-",
+    "R": ".-.",
+    "S": "...",
+    "T": "-",
+    "U": "..-",
+    "V": "...-",
+    "W": ".--",
+    "X": "-..-",
+    "Y": "-.--",
+    "Z": "--..",
+    "0": "-----",
+    "1": ".----",
+    "2": "..---",
+    "3": "...--",
+    "4": "....-",
+    "5": ".....",
+    "6": "-....",
+    "7": "--...",
+    "8": "---..",
+    "9": "----.",
+}
+
+
+# Morse code of each ASCII code point (either case), None when not encodable.
+_ENCODING_TABLE = [None] * 128
+for _char, _code in MORSE_CODE.items():
+    _ENCODING_TABLE[ord(_char)] = _ENCODING_TABLE[ord(_char.lower())] = _code
+del _char, _code
 
 
 def convert_to_morse(input_str: str) -> str:
     """
     Convert an input string to Morse code.
 
+    Validation and encoding are fused into a single pass: the ASCII bytes of
+    the input index a table built once at import, and a character without a
+    code makes the encoding or the join fail.
+
     Args:
         input_str (str): The string to be converted.
 
@@ -18,56 +86,124 @@ def convert_to_morse(input_str: str) -> str:
     Raises:
         AssertionError: If the input string contains invalid characters.
     """
-    morse_code_dict = {
-        " ": "/",
-        "A": ".-",
-        "B": "-...",
-        "C": "-.-.",
-        "D": "-..",
-        "E": ".",
-        "F": "..-.",
-        "G": "--.",
-        "H": "....",
-        "I": "..",
-        "J": ".---",
-        "K": "-.-",
-        "L": ".-..",
-        "M": "--",
-        "N": "-.",
-        "O": "---",
-        "P": ".--.",
-        "Q": "--.-",
-        "R": ".-.",
-        "S": "...",
-        "T": "-",
-        "U": "..-",
-        "V": "...-",
-        "W": ".--",
-        "X": "-..-",
-        "Y": "-.--",
-        "Z": "--..",
-        "0": "-----",
-        "1": ".----",
-        "2": "..---",
-        "3": "...--",
-        "4": "....-",
-        "5": ".....",
-        "6": "-....",
-        "7": "--...",
-        "8": "---..",
-        "9": "----.",
-    }
-
-    input_str = input_str.upper()
-    morse_code = []
-
-    for char in input_str:
-        if char in morse_code_dict:
-            morse_code.append(morse_code_dict[char])
-        else:
+    try:
+        return ' '.join(map(_ENCODING_TABLE.__getitem__,
+                            input_str.encode('ascii')))
+    except (UnicodeEncodeError, TypeError):
+        raise AssertionError("the arguments are bad") from None
+
+
+# Character of each Morse code, "/" decoding to the word separator. A list
+# indexed by the code's bit pattern (dit=0, dah=1) would avoid hashing the
+# code strings, but parsing each code into that index costs more than the
+# hash of a 1-5 character string: tester.py times both, and the pattern
+# index decodes 3 to 5 times slower.
+_DECODING_TABLE = {code: char for char, code in MORSE_CODE.items()}
+
+
+def convert_from_morse(morse: str) -> str:
+    """
+    Convert Morse code, as produced by convert_to_morse, back to text.
+
+    The codes are split on whitespace and looked up in a reverse table built
+    once at import, in a single O(symbols) pass.
+
+    Args:
+        morse (str): Codes separated by whitespace, "/" separating words.
+
+    Returns:
+        str: The decoded (upper case) text.
+
+    Raises:
+        AssertionError: If the input is not valid Morse code.
+    """
+    try:
+        return "".join(map(_DECODING_TABLE.__getitem__, morse.split()))
+    except KeyError:
+        raise AssertionError("the arguments are bad") from None
+
+
+def encode_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Convert text chunks to Morse code, keeping line breaks.
+
+    Each line is encoded like convert_to_morse would; a line may be split
+    across any number of chunks, so only the separator owed before the next
+    code is carried from one chunk to the next.
+
+    Args:
+        chunks (Iterable[str]): Consecutive pieces of the text.
+
+    Yields:
+        str: Consecutive pieces of the Morse code.
+
+    Raises:
+        AssertionError: If the text contains invalid characters.
+    """
+    separator = ""
+    for chunk in chunks:
+        parts = []
+        for index, line in enumerate(chunk.split("\n")):
+            if index:
+                parts.append("\n")
+                separator = ""
+            if line:
+                parts.append(separator + convert_to_morse(line))
+                separator = " "
+        yield "".join(parts)
+
+
+def decode_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Convert Morse code chunks back to text, keeping line breaks.
+
+    A code split across two chunks is carried over until its terminating
+    whitespace is read. Codes are at most five symbols long, so the carried
+    text stays bounded whatever the stream size.
+
+    Args:
+        chunks (Iterable[str]): Consecutive pieces of the Morse code.
+
+    Yields:
+        str: Consecutive pieces of the decoded text.
+
+    Raises:
+        AssertionError: If the input is not valid Morse code.
+    """
+    carry = ""
+    for chunk in chunks:
+        block = carry + chunk
+        cut = max(block.rfind(" "), block.rfind("\t"), block.rfind("\n")) + 1
+        block, carry = block[:cut], block[cut:]
+        if len(carry) > _MAX_CODE_LENGTH:
             raise AssertionError("the arguments are bad")
+        yield "\n".join(map(convert_from_morse, block.split("\n")))
+    yield convert_from_morse(carry)
 
-    return ' '.join(morse_code)
+
+def convert_files(paths: List[str], decode: bool = False) -> None:
+    """
+    Stream files (or stdin for "-") through the encoder or the decoder and
+    write the result to stdout as it is produced.
+
+    Args:
+        paths (List[str]): Paths of the files to convert, in order.
+        decode (bool): Decode Morse code instead of encoding text.
+
+    Raises:
+        AssertionError: If an input cannot be converted.
+        OSError: If a file cannot be opened or read.
+    """
+    convert = decode_stream if decode else encode_stream
+    for path in paths:
+        stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            for piece in convert(iter(partial(stream.read, CHUNK_SIZE), "")):
+                sys.stdout.write(piece)
+        finally:
+            # stdin belongs to the caller
+            if stream is not sys.stdin:
+                stream.close()
 
 
 def main() -> None:
@@ -75,20 +211,22 @@ def main() -> None:
     Main function to handle input arguments and convert them to Morse code.
     """
     try:
-        if len(sys.argv) != 2:
-            raise AssertionError("the arguments are bad")
+        if len(sys.argv) >= 2 and sys.argv[1] in ("--encode", "--decode"):
+            convert_files(sys.argv[2:] or ["-"], sys.argv[1] == "--decode")
+            return
 
-        input_str = sys.argv[1]
-
-        if not all(char.isalnum() or char == ' ' for char in input_str):
+        if len(sys.argv) != 2:
             raise AssertionError("the arguments are bad")
 
-        encoded_message = convert_to_morse(input_str)
+        encoded_message = convert_to_morse(sys.argv[1])
         print(encoded_message)
 
     except AssertionError as error:
         print(f"AssertionError: {error}")
         sys.exit(1)
+    except OSError as error:
+        print(f"{type(error).__name__}: {error}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
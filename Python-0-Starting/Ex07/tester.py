@@ -0,0 +1,144 @@
+"""
+tester.py
+
+Checks convert_to_morse against a straightforward per-character encoder,
+round-trips it through convert_from_morse, checks the keying bitstream and
+benchmarks encoding, decoding (against a bit-pattern index decoder) and WAV
+rendering on large messages.
+"""
+
+import os
+import tempfile
+import time
+from morse_render import morse_to_bitstream, render_wav
+from sos import (
+    MORSE_CODE,
+    convert_from_morse,
+    convert_to_morse,
+    decode_stream,
+    encode_stream,
+)
+
+
+def naive_morse(input_str: str) -> str:
+    """Reference encoder: dictionary lookup and list append per character."""
+    morse_code = []
+    for char in input_str.upper():
+        if char not in MORSE_CODE:
+            raise AssertionError("the arguments are bad")
+        morse_code.append(MORSE_CODE[char])
+    return ' '.join(morse_code)
+
+
+# Index of a Morse code in _PATTERN_TABLE: dit=0, dah=1, after a leading 1
+# bit that keeps the length ("." is 0b10, "-" is 0b11).
+_TO_BITS = str.maketrans(".-", "01")
+_PATTERN_TABLE = [None] * 64
+for _char, _code in MORSE_CODE.items():
+    if _code != "/":
+        _PATTERN_TABLE[int("1" + _code.translate(_TO_BITS), 2)] = _char
+
+
+def pattern_decoder(morse: str) -> str:
+    """
+    Bit-pattern decoder: each code indexes a list instead of hashing a
+    string, the alternative to sos.py's dict that the decoder was measured
+    against.
+    """
+    chars = []
+    for code in morse.split():
+        if code == "/":
+            chars.append(" ")
+            continue
+        char = None
+        if len(code) <= 5 and not code.strip(".-"):
+            char = _PATTERN_TABLE[int("1" + code.translate(_TO_BITS), 2)]
+        if char is None:
+            raise AssertionError("the arguments are bad")
+        chars.append(char)
+    return "".join(chars)
+
+
+def split_chunks(text: str, size: int) -> list:
+    """Cut text into chunks of size characters."""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def benchmark(function, text: str) -> float:
+    """Return the time in seconds taken by function(text)."""
+    start = time.perf_counter()
+    function(text)
+    return time.perf_counter() - start
+
+
+def main():
+    """Check a few messages, then time both encoders on a large message."""
+    for message in ["sos", "Hello World 42", "", " "]:
+        assert convert_to_morse(message) == naive_morse(message), message
+        print(f"{message!r} -> {convert_to_morse(message)!r}")
+
+    for message in ["SOS", "HELLO WORLD 42", ""]:
+        assert convert_from_morse(convert_to_morse(message)) == message
+
+    for message in ["sos!", "a.b", "tab\there"]:
+        try:
+            convert_to_morse(message)
+        except AssertionError:
+            print(f"{message!r} rejected")
+        else:
+            raise AssertionError(f"{message!r} should be rejected")
+
+    for morse in ["......", ".-x", "0"]:
+        for decoder in (convert_from_morse, pattern_decoder):
+            try:
+                decoder(morse)
+            except AssertionError:
+                pass
+            else:
+                raise AssertionError(f"{morse!r} should be rejected")
+        print(f"{morse!r} rejected by the decoder")
+
+    lines = "SOS\n\nHello World 42\n  two  spaces \nend"
+    morse = "".join(encode_stream([lines]))
+    print(f"\nStreamed lines:\n{morse}")
+    for size in (1, 2, 3, 7, 64):
+        assert "".join(encode_stream(split_chunks(lines, size))) == morse
+        decoded = "".join(decode_stream(split_chunks(morse, size)))
+        assert decoded == lines.upper(), size
+    print("Chunk boundaries handled for chunk sizes 1, 2, 3, 7 and 64")
+
+    text = "The quick brown fox jumps over the lazy dog 0123456789 " * 80000
+    size = len(text) / 1e6
+    naive = benchmark(naive_morse, text)
+    fast = benchmark(convert_to_morse, text)
+    print(f"\nEncoding {size:.1f} MB of text:")
+    print(f"naive encoder:    {naive:.3f}s ({size / naive:.1f} MB/s)")
+    print(f"convert_to_morse: {fast:.3f}s ({size / fast:.1f} MB/s)")
+
+    morse = convert_to_morse(text)
+    decode = benchmark(convert_from_morse, morse)
+    pattern = benchmark(pattern_decoder, morse)
+    assert convert_from_morse(morse) == text.upper()
+    assert pattern_decoder(morse) == text.upper()
+    print(f"\nDecoding {len(morse) / 1e6:.1f} MB of Morse code:")
+    print(f"bit-pattern index:  {pattern:.3f}s")
+    print(f"convert_from_morse: {decode:.3f}s "
+          f"(x{pattern / decode:.1f} faster)")
+
+    bits = "".join(map(str, morse_to_bitstream(convert_to_morse("SOS E"))))
+    assert bits == "10101000111011101110001010100000001", bits
+    print(f"\nBitstream of 'SOS E': {bits}")
+
+    message = convert_to_morse(text[:20000])
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "message.wav")
+        start = time.perf_counter()
+        duration = render_wav(message, path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path) / 1e6
+    print(f"render_wav: {duration / 60:.0f} min of audio ({size:.0f} MB) "
+          f"in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Benchmark suite and regression harness for ft_package utilities.
+
+Times count_in_list and reverse_list over sizes from 1e2 to 1e7 elements and
+several element types, writes the results as JSON, and optionally compares
+them with a stored baseline, failing when a case got slower than allowed.
+The loop generic iterables go through is also timed on each backend (the
+pure-Python one and, when built, the C accelerator) for comparison.
+
+Usage:
+    python benchmarks.py [--max-size N] [--output results.json]
+                         [--compare baseline.json] [--threshold 1.25]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from array import array
+from collections import deque
+from typing import Any, Callable, Dict, List, Tuple
+
+from ft_package import count_in_list, reverse_list, utils
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, its cases are then skipped
+    np = None
+
+SIZES = [10 ** exponent for exponent in range(2, 8)]
+
+# Default slowdown ratio above which a case is reported as a regression.
+THRESHOLD = 1.25
+
+# Differences below this many seconds are timer noise, never regressions.
+NOISE_FLOOR = 1e-6
+
+# Minimum total time of one timing run; small cases are repeated to reach it.
+MIN_RUN_TIME = 0.05
+
+# Cases going through the generic-iterable loop, timed on every backend.
+GENERIC_KINDS = ["int-deque", "float-deque", "str-deque"]
+
+
+def _make_inputs(size: int) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Build the benchmark inputs of one size, with the target to count.
+
+    Args:
+        size (int): Number of elements.
+
+    Returns:
+        Dict[str, Tuple[Any, Any]]: (items, target) by element type name.
+    """
+    words = ["toto", "tata", "titi", "tutu"]
+    inputs = {
+        "int-list": ([i % 100 for i in range(size)], 42),
+        "str-list": ([words[i % 4] for i in range(size)], "toto"),
+        "float-list": ([float(i % 100) for i in range(size)], 42.0),
+        "int-tuple": (tuple(i % 100 for i in range(size)), 42),
+        "int-array": (array("q", (i % 100 for i in range(size))), 42),
+        "bytes": (bytes(i % 100 for i in range(size)), 42),
+        "int-deque": (deque(i % 100 for i in range(size)), 42),
+        "float-deque": (deque(float(i % 100) for i in range(size)), 42.0),
+        "str-deque": (deque(words[i % 4] for i in range(size)), "toto"),
+    }
+    if np is not None:
+        inputs["int-ndarray"] = (np.arange(size, dtype=np.int64) % 100, 42)
+    return inputs
+
+
+def time_call(function: Callable, *args: Any, repeat: int = 5) -> float:
+    """
+    Measure the best time of one call, repeating short calls.
+
+    Args:
+        function (Callable): The function to time.
+        *args (Any): Arguments passed to the function.
+        repeat (int): Number of timing runs; the fastest one is kept.
+
+    Returns:
+        float: Seconds per call.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_RUN_TIME or number >= 1 << 20:
+            break
+        number *= 10
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def run(sizes: List[int], repeat: int = 5) -> Dict[str, float]:
+    """
+    Run every benchmark case.
+
+    Args:
+        sizes (List[int]): Numbers of elements to benchmark.
+        repeat (int): Number of timing runs per case.
+
+    Returns:
+        Dict[str, float]: Seconds per call by "function/type/size" case name.
+    """
+    results = {}
+    for size in sizes:
+        for kind, (items, target) in _make_inputs(size).items():
+            results[f"count_in_list/{kind}/{size}"] = time_call(
+                count_in_list, items, target, repeat=repeat)
+            results[f"reverse_list/{kind}/{size}"] = time_call(
+                reverse_list, items, repeat=repeat)
+    return results
+
+
+def run_backends(sizes: List[int], repeat: int = 5) -> Dict[str, float]:
+    """
+    Time the generic-iterable loop of count_in_list on every backend.
+
+    Args:
+        sizes (List[int]): Numbers of elements to benchmark.
+        repeat (int): Number of timing runs per case.
+
+    Returns:
+        Dict[str, float]: Seconds per call by "backend-name/type/size" case
+        name; the C backend is missing when the extension is not built.
+    """
+    loops = {"python": utils._count_iterable}
+    if utils.backend == "c":
+        loops["c"] = utils._count_generic
+    results = {}
+    for size in sizes:
+        inputs = _make_inputs(size)
+        for kind in GENERIC_KINDS:
+            items, target = inputs[kind]
+            for name, loop in loops.items():
+                results[f"backend-{name}/{kind}/{size}"] = time_call(
+                    loop, items, target, repeat=repeat)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = THRESHOLD) -> List[str]:
+    """
+    Find the cases that regressed past threshold versus a baseline.
+
+    Args:
+        results (Dict[str, float]): Current seconds per call by case.
+        baseline (Dict[str, float]): Baseline seconds per call by case.
+        threshold (float): Allowed slowdown ratio.
+
+    Returns:
+        List[str]: The regressed case names; cases missing from either side
+        are ignored.
+    """
+    return [
+        case for case, seconds in results.items()
+        if case in baseline
+        and seconds > baseline[case] * threshold
+        and seconds - baseline[case] > NOISE_FLOOR
+    ]
+
+
+def main() -> None:
+    """
+    Run the suite, print a table, save and compare results as requested.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-size", type=int, default=SIZES[-1],
+                        help="largest number of elements benchmarked")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing runs per case, the fastest is kept")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="fail if slower than this JSON result file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown ratio versus the baseline")
+    args = parser.parse_args()
+
+    sizes = [size for size in SIZES if size <= args.max_size]
+    results = run(sizes, args.repeat)
+    backends = run_backends(sizes, args.repeat)
+    results.update(backends)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+    for case, seconds in results.items():
+        line = f"{case:<36} {seconds * 1e6:>14.2f} us"
+        if case in baseline:
+            line += f"  x{seconds / baseline[case]:.2f} vs baseline"
+        print(line)
+
+    print(f"\nGeneric-iterable loop, active backend: {utils.backend}")
+    for case, seconds in backends.items():
+        if case.startswith("backend-c/"):
+            pure = backends["backend-python/" + case.split("/", 1)[1]]
+            print(f"{case.split('/', 1)[1]:<24} python {pure * 1e6:.2f} us, "
+                  f"c {seconds * 1e6:.2f} us (x{pure / seconds:.1f})")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            }, file, indent=2)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) past x{args.threshold}:")
+        for case in regressions:
+            print(f"  {case}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,42 @@
 ft_package: A sample Python package.
 
 This package provides utility functions for list operations.
+
+Submodules are imported lazily, on first access to one of their names, so
+that `import ft_package` stays cheap for short-lived processes.
 """
 
-from .utils import count_in_list, reverse_list
+import importlib
+
+# Public name -> submodule defining it.
+_LAZY_ATTRIBUTES = {
+    "backend": "utils",
+    "count_in_list": "utils",
+    "reverse_list": "utils",
+    "reversed_view": "views",
+    "FrequencyIndex": "index",
+    "ReversedView": "views",
+}
+
+__all__ = [
+    "backend",
+    "count_in_list",
+    "reverse_list",
+    "reversed_view",
+    "FrequencyIndex",
+    "ReversedView",
+]
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["count_in_list", "reverse_list"]
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,136 @@
+/*
+ * Optional C accelerator for ft_package.utils.
+ *
+ * Implements the loop count_in_list runs on generic iterables (deques,
+ * iterators, generators...). The package falls back to the pure-Python
+ * loop when this extension is not built.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/* How the items of the target's exact type are compared with it. */
+enum target_kind { GENERIC, FLOAT, SMALL_INT, STR };
+
+/*
+ * Return 1 if item == target, 0 if not, -1 on error.
+ *
+ * Items of the exact type of a float, int (fitting a long long) or str
+ * target are compared without going through rich comparison: the == of
+ * these types cannot be overridden and gives the same result. Any other
+ * item goes through ==, an identical float too, as NaN is not equal to
+ * itself.
+ */
+static int
+items_equal(PyObject *item, PyObject *target, enum target_kind kind,
+            long long target_value)
+{
+    PyObject *equal;
+    int truth, overflow;
+    long long item_value;
+
+    if (kind != GENERIC && Py_TYPE(item) == Py_TYPE(target)) {
+        switch (kind) {
+        case FLOAT:
+            return PyFloat_AS_DOUBLE(item) == PyFloat_AS_DOUBLE(target);
+        case SMALL_INT:
+            if (item == target)
+                return 1;
+            item_value = PyLong_AsLongLongAndOverflow(item, &overflow);
+            return !overflow && item_value == target_value;
+        case STR:
+            if (item == target)
+                return 1;
+            return PyUnicode_GET_LENGTH(item) == PyUnicode_GET_LENGTH(target)
+                && PyUnicode_KIND(item) == PyUnicode_KIND(target)
+                && memcmp(PyUnicode_DATA(item), PyUnicode_DATA(target),
+                          PyUnicode_GET_LENGTH(item)
+                          * PyUnicode_KIND(item)) == 0;
+        default:
+            break;
+        }
+    }
+    if (item != target)
+        return PyObject_RichCompareBool(item, target, Py_EQ);
+    equal = PyObject_RichCompare(item, target, Py_EQ);
+    if (equal == NULL)
+        return -1;
+    truth = PyObject_IsTrue(equal);
+    Py_DECREF(equal);
+    return truth;
+}
+
+PyDoc_STRVAR(count_equal_doc,
+"count_equal(items, target) -> int\n\n"
+"Count the items of an iterable for which item == target is true.");
+
+static PyObject *
+count_equal(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *iterator, *item, *target;
+    iternextfunc next;
+    enum target_kind kind = GENERIC;
+    long long target_value = 0;
+    Py_ssize_t count = 0;
+
+    if (nargs != 2) {
+        PyErr_SetString(PyExc_TypeError, "count_equal expected 2 arguments");
+        return NULL;
+    }
+    target = args[1];
+    if (PyFloat_CheckExact(target))
+        kind = FLOAT;
+    else if (PyUnicode_CheckExact(target))
+        kind = STR;
+    else if (PyLong_CheckExact(target)) {
+        int overflow;
+
+        target_value = PyLong_AsLongLongAndOverflow(target, &overflow);
+        if (!overflow)
+            kind = SMALL_INT;
+    }
+    iterator = PyObject_GetIter(args[0]);
+    if (iterator == NULL)
+        return NULL;
+    next = Py_TYPE(iterator)->tp_iternext;
+
+    while ((item = next(iterator)) != NULL) {
+        int truth = items_equal(item, target, kind, target_value);
+
+        Py_DECREF(item);
+        if (truth < 0)
+            goto error;
+        count += truth;
+    }
+    if (PyErr_Occurred()) {
+        if (!PyErr_ExceptionMatches(PyExc_StopIteration))
+            goto error;
+        PyErr_Clear();
+    }
+    Py_DECREF(iterator);
+    return PyLong_FromSsize_t(count);
+
+error:
+    Py_DECREF(iterator);
+    return NULL;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"count_equal", (PyCFunction)(void (*)(void))count_equal,
+     METH_FASTCALL, count_equal_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "ft_package._speedups",
+    "C accelerator for ft_package.utils.",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
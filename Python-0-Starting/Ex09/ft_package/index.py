@@ -0,0 +1,180 @@
+"""
+Frequency index for ft_package.
+
+This module provides an index answering repeated count queries on the same
+list without rescanning it.
+"""
+
+import os
+from collections import Counter
+from typing import Any, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+
+def _count_chunk(items: Sequence[Hashable]) -> Counter:
+    """
+    Count the items of one chunk (run in a worker process).
+
+    Args:
+        items (Sequence[Hashable]): The chunk to count.
+
+    Returns:
+        Counter: The number of occurrences of every item of the chunk.
+    """
+    return Counter(items)
+
+
+class FrequencyIndex:
+    """
+    Number of occurrences of every element of a list.
+
+    The index is built in a single pass and then answers count queries in
+    O(1), giving the same result as count_in_list for hashable elements.
+    It is kept up to date with add, extend and remove as the underlying list
+    changes, and indexes built over separate chunks can be merged.
+    """
+
+    def __init__(self, items: Iterable[Hashable] = ()) -> None:
+        """
+        Build the index in one pass over items.
+
+        Args:
+            items (Iterable[Hashable]): The elements to index.
+
+        Raises:
+            TypeError: If an element is not hashable.
+        """
+        self._counts = Counter(items)
+        self._total = sum(self._counts.values())
+
+    @classmethod
+    def from_chunks(cls, items: Sequence[Hashable],
+                    workers: Optional[int] = None,
+                    chunksize: Optional[int] = None) -> "FrequencyIndex":
+        """
+        Build the index of a large sequence in parallel.
+
+        The sequence is cut into chunks that are counted in a process pool,
+        and the partial indexes are merged.
+
+        Args:
+            items (Sequence[Hashable]): The elements to index; they must be
+                picklable.
+            workers (Optional[int]): Size of the process pool, defaults to the
+                number of CPUs.
+            chunksize (Optional[int]): Number of elements per chunk, defaults
+                to an even split between the workers.
+
+        Returns:
+            FrequencyIndex: The index of all the elements.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = workers or os.cpu_count() or 1
+        chunksize = chunksize or max(1, -(-len(items) // workers))
+        chunks = [items[start:start + chunksize]
+                  for start in range(0, len(items), chunksize)]
+        index = cls()
+        if workers == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                index.extend(chunk)
+            return index
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for counts in executor.map(_count_chunk, chunks):
+                index._add_counts(counts)
+        return index
+
+    def _add_counts(self, counts: Counter) -> None:
+        """Add precomputed counts to the index."""
+        self._counts.update(counts)
+        self._total += sum(counts.values())
+
+    def count(self, target: Any) -> int:
+        """
+        Count the number of occurrences of a target element, in O(1).
+
+        Args:
+            target (Any): The element to count.
+
+        Returns:
+            int: The number of times the target appears in the indexed list;
+            0 for unhashable targets, which cannot be in the index.
+        """
+        try:
+            return self._counts.get(target, 0)
+        except TypeError:
+            return 0
+
+    def add(self, item: Hashable) -> None:
+        """
+        Record an element appended to the indexed list.
+
+        Args:
+            item (Hashable): The appended element.
+        """
+        self._counts[item] += 1
+        self._total += 1
+
+    def extend(self, items: Iterable[Hashable]) -> None:
+        """
+        Record several elements appended to the indexed list.
+
+        Args:
+            items (Iterable[Hashable]): The appended elements.
+        """
+        self._add_counts(Counter(items))
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Record an element removed from the indexed list.
+
+        Args:
+            item (Hashable): The removed element.
+
+        Raises:
+            ValueError: If the element is not in the index.
+        """
+        count = self._counts.get(item, 0)
+        if not count:
+            raise ValueError(f"{item!r} is not in the index")
+        if count == 1:
+            del self._counts[item]
+        else:
+            self._counts[item] = count - 1
+        self._total -= 1
+
+    def merge(self, other: "FrequencyIndex") -> "FrequencyIndex":
+        """
+        Combine two indexes, e.g. built over consecutive chunks of a list.
+
+        Args:
+            other (FrequencyIndex): The index to merge with this one.
+
+        Returns:
+            FrequencyIndex: A new index counting the elements of both.
+        """
+        merged = FrequencyIndex()
+        merged._add_counts(self._counts)
+        merged._add_counts(other._counts)
+        return merged
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """
+        List the most frequent elements.
+
+        Args:
+            n (Optional[int]): Number of elements to return, all by default.
+
+        Returns:
+            List[Tuple[Any, int]]: (element, count) pairs, most frequent first.
+        """
+        return self._counts.most_common(n)
+
+    def __contains__(self, item: Any) -> bool:
+        return self.count(item) > 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed elements, duplicates included."""
+        return self._total
+
+    def __repr__(self) -> str:
+        return f"FrequencyIndex({dict(self._counts)!r})"
@@ -2,22 +2,67 @@
 Utility functions for ft_package.
 
 This module provides functions to perform operations on lists.
+
+Both functions run in O(n). Lists and tuples are handled by their C-level
+methods, array.array and bytes-like objects by their own count and slicing,
+and NumPy arrays (NumPy is never imported by the package) by vectorized
+comparison and negative-stride views. Any other iterable is counted by the
+optional ft_package._speedups C extension when it is built, by a
+pure-Python loop otherwise; backend tells which one is active.
 """
 
+import sys
+from array import array
 from typing import List, Any
 
 
-def count_in_list(items: List[Any], target: Any) -> int:
+def _ndarray_type():
     """
-    Count the number of occurrences of a target element in a list.
+    Return numpy.ndarray if NumPy has already been imported, else None.
 
-    Args:
-        items (List[Any]): The list to search.
-        target (Any): The element to count.
+    An ndarray can only be passed in once NumPy is imported, so NumPy is
+    never imported here just to check argument types.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy.ndarray if numpy is not None else None
 
-    Returns:
-        int: The number of times the target appears in the list.
+
+def _equals_itself(target: Any) -> bool:
+    """
+    Tell whether target == target is true.
+
+    The C-level count of lists and tuples takes an item identical to the
+    target as a match without calling ==. The result only differs from
+    the == loop for targets not equal to themselves, such as NaN.
     """
+    try:
+        return bool(target == target)
+    except (TypeError, ValueError):
+        return False
+
+
+def _count_ndarray(items: Any, target: Any) -> int:
+    """
+    Count the items of an ndarray equal to target, vectorized.
+
+    The items of an array are its rows, so a row matches when all its
+    elements are equal to those of target.
+
+    Raises:
+        ValueError: If target does not have the shape of an item.
+    """
+    numpy = sys.modules["numpy"]
+    if numpy.shape(target) != items.shape[1:]:
+        raise ValueError(
+            f"target must have the shape {items.shape[1:]} of an item")
+    matches = items == target
+    if items.ndim > 1:
+        matches = matches.reshape(len(items), -1).all(axis=1)
+    return int(numpy.count_nonzero(matches))
+
+
+def _count_iterable(items: Any, target: Any) -> int:
+    """Pure-Python count of the items of any iterable equal to target."""
     count = 0
     for item in items:
         if item == target:
@@ -25,17 +70,71 @@ def count_in_list(items: List[Any], target: Any) -> int:
     return count
 
 
-def reverse_list(items: List[Any]) -> List[Any]:
+try:
+    from ._speedups import count_equal as _count_generic
+    backend = "c"
+except ImportError:  # The C accelerator is optional
+    _count_generic = _count_iterable
+    backend = "python"
+
+
+def _reverse_iterable(items: Any) -> List[Any]:
+    """Pure-Python reversed list of the items of any iterable."""
+    reversed_items = list(items)
+    reversed_items.reverse()
+    return reversed_items
+
+
+def count_in_list(items: List[Any], target: Any) -> int:
+    """
+    Count the number of occurrences of a target element in a list.
+
+    Args:
+        items (List[Any]): The list to search. Tuples, array.array,
+            bytes-like objects, NumPy arrays and other iterables are
+            accepted too.
+        target (Any): The element to count.
+
+    Returns:
+        int: The number of times the target appears in the list, an item
+        matching when item == target, whatever the container (NaN never
+        matches).
+
+    Raises:
+        ValueError: If items is an ndarray and target does not have the
+            shape of one of its items.
+    """
+    ndarray = _ndarray_type()
+    if ndarray is not None and isinstance(items, ndarray) and items.ndim:
+        return _count_ndarray(items, target)
+    if isinstance(items, (bytes, bytearray)) and type(target) is int:
+        # Iterating bytes yields ints: bytes.count matches them exactly, any
+        # other target (1.0, np.uint8(97)) goes through ==
+        return items.count(target) if 0 <= target <= 255 else 0
+    if isinstance(items, (list, tuple, array)) and _equals_itself(target):
+        return items.count(target)
+    return _count_generic(items, target)
+
+
+def reverse_list(items: List[Any]) -> Any:
     """
     Reverse the order of elements in a list.
 
     Args:
-        items (List[Any]): The list to reverse.
+        items (List[Any]): The list to reverse. Tuples and other iterables
+            are accepted too and give a list. array.array and bytes-like
+            objects give a reversed object of the same type, and NumPy arrays
+            a reversed view sharing their memory.
 
     Returns:
-        List[Any]: A new list with elements in reverse order.
+        Any: A new list with elements in reverse order; a new array.array
+        or bytes-like object for those, and a view for NumPy arrays.
     """
-    reversed_items = []
-    for item in items:
-        reversed_items.insert(0, item)
-    return reversed_items
\ No newline at end of file
+    ndarray = _ndarray_type()
+    if ndarray is not None and isinstance(items, ndarray):
+        return items[::-1]
+    if isinstance(items, (list, array, bytes, bytearray)):
+        return items[::-1]
+    if isinstance(items, tuple):
+        return list(items[::-1])
+    return _reverse_iterable(items)
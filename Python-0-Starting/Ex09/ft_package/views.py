@@ -0,0 +1,103 @@
+"""
+Reversed views for ft_package.
+
+This module provides a zero-copy alternative to reverse_list for sequences
+that only need to be read backward.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Iterator, List, Optional, Union
+
+from .utils import _ndarray_type
+
+
+class ReversedView(Sequence):
+    """
+    Read-only reversed view over a sequence.
+
+    The view keeps a reference to the sequence and a range of its indices,
+    so creating, indexing and slicing it never copies the elements. Changes
+    to existing elements of the sequence show through the view; its length
+    is fixed when the view is created.
+    """
+
+    __slots__ = ("_base", "_indices")
+
+    def __init__(self, base: Sequence,
+                 indices: Optional[range] = None) -> None:
+        """
+        Create the view.
+
+        Args:
+            base (Sequence): The sequence to view backward.
+            indices (range): Indices of base seen by the view, in order.
+                Defaults to every index, last first.
+        """
+        self._base = base
+        if indices is None:
+            indices = range(len(base) - 1, -1, -1)
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Return an element, or a new view for a slice.
+
+        Args:
+            index (Union[int, slice]): Position in the reversed order.
+
+        Returns:
+            Any: The element, or a ReversedView sharing the same sequence.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            return ReversedView(self._base, self._indices[index])
+        return self._base[self._indices[index]]
+
+    def __iter__(self) -> Iterator[Any]:
+        base, indices = self._base, self._indices
+        if indices.step == -1 and indices.start == len(base) - 1 \
+                and indices.stop == -1:
+            return reversed(base)
+        return map(base.__getitem__, indices)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return map(self._base.__getitem__, reversed(self._indices))
+
+    def materialize(self) -> List[Any]:
+        """
+        Copy the viewed elements into a new list.
+
+        Returns:
+            List[Any]: The elements in the order of the view.
+        """
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"ReversedView({self.materialize()!r})"
+
+
+def reversed_view(items: Sequence) -> Sequence:
+    """
+    Return the elements of a sequence in reverse order without copying them.
+
+    Args:
+        items (Sequence): The sequence to view backward.
+
+    Returns:
+        Sequence: A negative-stride view for NumPy arrays, a ReversedView
+        for any other sequence.
+
+    Raises:
+        TypeError: If items is not a sequence.
+    """
+    ndarray = _ndarray_type()
+    if ndarray is not None and isinstance(items, ndarray):
+        return items[::-1]
+    if not isinstance(items, Sequence):
+        raise TypeError(f"'{type(items).__name__}' object is not a sequence")
+    return ReversedView(items)
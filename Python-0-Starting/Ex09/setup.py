@@ -1,7 +1,18 @@
 """
 Setup script for ft_package.
+
+The C accelerator is optional: if it cannot be compiled, the package is
+installed with its pure-Python implementation only.
 """
 
-from setuptools import setup, find_packages
+from setuptools import Extension, setup
 
-setup()
\ No newline at end of file
+setup(
+    ext_modules=[
+        Extension(
+            "ft_package._speedups",
+            sources=["ft_package/_speedups.c"],
+            optional=True,
+        ),
+    ],
+)
@@ -0,0 +1,56 @@
+"""
+Test suite for the benchmarks.py regression harness.
+"""
+
+import unittest
+from unittest import mock
+import benchmarks
+from ft_package import reverse_list, utils
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for the benchmark runner and comparison."""
+
+    def test_run(self):
+        """Test that every function and type is timed for every size."""
+        # One call per case is enough to check the results
+        with mock.patch.object(benchmarks, "MIN_RUN_TIME", 0):
+            results = benchmarks.run([100, 1000], repeat=1)
+        self.assertIn("count_in_list/int-deque/100", results)
+        for size in (100, 1000):
+            for function in ("count_in_list", "reverse_list"):
+                self.assertIn(f"{function}/int-list/{size}", results)
+                self.assertIn(f"{function}/bytes/{size}", results)
+        self.assertTrue(all(seconds >= 0 for seconds in results.values()))
+
+    def test_run_backends(self):
+        """Test that the generic loop is timed on every available backend."""
+        with mock.patch.object(benchmarks, "MIN_RUN_TIME", 0):
+            results = benchmarks.run_backends([100], repeat=1)
+        backends = ["python"] + (["c"] if utils.backend == "c" else [])
+        self.assertEqual(len(results),
+                         len(backends) * len(benchmarks.GENERIC_KINDS))
+        for backend in backends:
+            self.assertIn(f"backend-{backend}/int-deque/100", results)
+
+    def test_compare(self):
+        """Test that only slowdowns past the threshold are regressions."""
+        baseline = {"a": 1e-3, "b": 1e-3, "c": 1e-3, "d": 1e-8}
+        results = {"a": 1.1e-3, "b": 2e-3, "c": 0.5e-3, "d": 1e-7, "e": 1.0}
+        self.assertEqual(benchmarks.compare(results, baseline, 1.25), ["b"])
+        self.assertEqual(benchmarks.compare(results, baseline, 3.0), [])
+
+
+class TestLargeInputs(unittest.TestCase):
+    """Results of the functions on the sizes the benchmarks use."""
+
+    def test_reverse_one_million_items(self):
+        """reverse_list on 1M items gives a new, fully reversed list."""
+        items = list(range(1_000_000))
+        reversed_items = reverse_list(items)
+        self.assertEqual(reversed_items, items[::-1])
+        self.assertEqual(items[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Import cost of ft_package.
+
+Imports ft_package in a fresh interpreter and checks that the bare import
+loads none of its submodules and nothing heavy, whatever the machine speed.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Modules that must only be loaded when actually needed.
+LAZY_MODULES = [
+    "numpy",
+    "ft_package.utils",
+    "ft_package.index",
+    "ft_package.views",
+    "concurrent.futures",
+]
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(statement):
+    """
+    Run statement in a fresh interpreter.
+
+    Returns:
+        set: Names of the modules in sys.modules afterwards.
+    """
+    env = dict(os.environ, PYTHONPATH=PACKAGE_DIR)
+    result = subprocess.run(
+        [sys.executable, "-c",
+         f"{statement}; import sys; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, env=env, check=True)
+    return set(result.stdout.split())
+
+
+class TestImportTime(unittest.TestCase):
+    """Cost of importing ft_package."""
+
+    def test_import_loads_no_submodule(self):
+        modules = loaded_modules("import ft_package")
+        self.assertIn("ft_package", modules)
+        for module in ("ft_package.index", "ft_package.views",
+                       "ft_package.utils"):
+            self.assertNotIn(module, modules)
+
+    def test_import_is_lazy(self):
+        modules = loaded_modules("import ft_package")
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_first_use_loads_only_its_submodule(self):
+        modules = loaded_modules("import ft_package; ft_package.count_in_list")
+        self.assertIn("ft_package.utils", modules)
+        self.assertNotIn("ft_package.index", modules)
+        self.assertNotIn("numpy", modules)
+
+    def test_lazy_names(self):
+        import ft_package
+        for name in ft_package.__all__:
+            self.assertIn(name, dir(ft_package))
+            self.assertIsNotNone(getattr(ft_package, name))
+        with self.assertRaises(AttributeError):
+            ft_package.not_a_name
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Test suite for ft_package.index module.
+"""
+
+import unittest
+from ft_package import FrequencyIndex, count_in_list
+
+
+class TestFrequencyIndex(unittest.TestCase):
+    """Test cases for FrequencyIndex."""
+
+    def test_count(self):
+        """Test that counts match count_in_list."""
+        items = ["toto", "tata", "toto", 1, 1.0, None]
+        index = FrequencyIndex(items)
+        for target in ["toto", "tata", "tutu", 1, None]:
+            self.assertEqual(index.count(target), count_in_list(items, target))
+        self.assertEqual(index.count([1]), 0)
+        self.assertEqual(len(index), 6)
+        self.assertIn("toto", index)
+        self.assertNotIn("tutu", index)
+
+    def test_updates(self):
+        """Test add, extend and remove."""
+        index = FrequencyIndex(["a"])
+        index.add("b")
+        index.extend(["a", "c"])
+        self.assertEqual(index.count("a"), 2)
+        index.remove("a")
+        index.remove("c")
+        self.assertEqual(index.count("a"), 1)
+        self.assertNotIn("c", index)
+        self.assertEqual(len(index), 2)
+        with self.assertRaises(ValueError):
+            index.remove("c")
+
+    def test_merge_and_chunks(self):
+        """Test merging partial indexes and building them in parallel."""
+        items = [i % 7 for i in range(1000)]
+        merged = FrequencyIndex(items[:300]).merge(FrequencyIndex(items[300:]))
+        parallel = FrequencyIndex.from_chunks(items, workers=2, chunksize=128)
+        for target in range(8):
+            expected = items.count(target)
+            self.assertEqual(merged.count(target), expected)
+            self.assertEqual(parallel.count(target), expected)
+        self.assertEqual(len(parallel), 1000)
+        self.assertEqual(parallel.most_common(1), [(0, 143)])
+
+    def test_queries_do_not_rescan(self):
+        """Count queries must not iterate the source list again."""
+        class Source(list):
+            passes = 0
+
+            def __iter__(self):
+                Source.passes += 1
+                return super().__iter__()
+
+        items = Source(i % 1000 for i in range(100_000))
+        index = FrequencyIndex(items)
+        self.assertEqual(Source.passes, 1)
+        for target in range(1000):
+            self.assertEqual(index.count(target), 100)
+        self.assertEqual(Source.passes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,14 @@ Test suite for ft_package.utils module.
 """
 
 import unittest
-from ft_package import count_in_list, reverse_list
+from array import array
+from collections import deque
+from ft_package import count_in_list, reverse_list, utils
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestUtils(unittest.TestCase):
@@ -22,6 +29,100 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(reverse_list([]), [])
         self.assertEqual(reverse_list([1, 2, 3, 4]), [4, 3, 2, 1])
 
+    def test_count_in_list_fast_paths(self):
+        """Test count_in_list on tuples, arrays, bytes and iterators."""
+        self.assertEqual(count_in_list(("a", "b", "a"), "a"), 2)
+        self.assertEqual(count_in_list(array("i", [1, 2, 1, 1]), 1), 3)
+        self.assertEqual(count_in_list(b"banana", ord("a")), 3)
+        self.assertEqual(count_in_list(bytearray(b"banana"), b"a"), 0)
+        self.assertEqual(count_in_list(b"banana", 1000), 0)
+        self.assertEqual(count_in_list(b"\x01\x01", 1.0), 2)
+        self.assertEqual(count_in_list(b"\x01\x01", True), 2)
+        self.assertEqual(count_in_list(iter([1, 2, 1]), 1), 2)
+
+    def test_count_in_list_nan(self):
+        """Test that NaN never matches, whatever the container."""
+        nan = float("nan")
+        for items in ([nan, nan], (nan, nan), deque([nan, nan]),
+                      array("d", [nan, nan]), iter([nan, nan])):
+            self.assertEqual(count_in_list(items, nan), 0)
+        self.assertEqual(count_in_list([nan, 1.0, 1], 1), 2)
+
+    def test_reverse_list_fast_paths(self):
+        """Test reverse_list on tuples, arrays, bytes and iterators."""
+        self.assertEqual(reverse_list(("a", "b")), ["b", "a"])
+        self.assertEqual(reverse_list(array("i", [1, 2, 3])),
+                         array("i", [3, 2, 1]))
+        self.assertEqual(reverse_list(b"abc"), b"cba")
+        self.assertEqual(reverse_list(iter([1, 2, 3])), [3, 2, 1])
+        items = [1, 2, 3]
+        self.assertIsNot(reverse_list(items), items)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_ndarray_fast_paths(self):
+        """Test that ndarrays are counted vectorized and reversed as views."""
+        values = np.array([3, 1, 3, 3, 2])
+        self.assertEqual(count_in_list(values, 3), 3)
+        self.assertEqual(count_in_list(values, 7), 0)
+        self.assertEqual(count_in_list(np.array([np.nan, np.nan]), np.nan),
+                         0)
+        self.assertEqual(count_in_list(
+            np.array([np.nan, np.nan], dtype=object), np.nan), 0)
+        rows = np.array([[1, 2], [3, 4], [1, 2]])
+        self.assertEqual(count_in_list(rows, [1, 2]), 2)
+        self.assertEqual(count_in_list(rows, np.array([3, 4])), 1)
+        self.assertEqual(count_in_list(rows, [2, 1]), 0)
+        self.assertEqual(count_in_list(b"aab", np.uint8(97)), 2)
+        with self.assertRaises(ValueError):
+            count_in_list(rows, 1)
+        with self.assertRaises(ValueError):
+            count_in_list(values, [3, 3])
+        reversed_values = reverse_list(values)
+        self.assertEqual(reversed_values.tolist(), [2, 3, 3, 1, 3])
+        self.assertTrue(np.shares_memory(reversed_values, values))
+
+    def test_generic_iterables(self):
+        """Test the pure-Python paths taken by other iterables."""
+        self.assertEqual(count_in_list(deque([1, 2, 1]), 1), 2)
+        self.assertEqual(count_in_list(iter([]), 1), 0)
+        self.assertEqual(reverse_list(deque([1, 2, 3])), [3, 2, 1])
+        self.assertEqual(reverse_list(iter("ab")), ["b", "a"])
+        with self.assertRaises(TypeError):
+            count_in_list(42, 1)
+        with self.assertRaises(TypeError):
+            reverse_list(42)
+
+    @unittest.skipIf(utils.backend != "c", "C accelerator is not built")
+    def test_c_backend(self):
+        """Test that the C loop counts like the pure-Python one."""
+        class Always(int):
+            def __eq__(self, other):
+                return True
+
+            __hash__ = int.__hash__
+
+        nan = float("nan")
+        cases = [
+            ([1, 1.0, True, "1", None, 2, 10 ** 30], 1),
+            ([10 ** 30, 10 ** 30 + 1, 10 ** 30], 10 ** 30),
+            ([-1, 2 ** 63, -(2 ** 63)], -(2 ** 63)),
+            ([1.5, 1.5, nan, 2], 1.5),
+            ([nan, nan], nan),
+            (["a", "é", "é", "ab", "\U0001f600"], "é"),
+            (["\U0001f600", "a"], "\U0001f600"),
+            ([Always(3), 3, 4], 3),
+            ([(1, 2), (1, 2), [1, 2]], (1, 2)),
+        ]
+        for items, target in cases:
+            for container in (deque, iter):
+                self.assertEqual(
+                    utils._count_generic(container(items), target),
+                    utils._count_iterable(container(items), target))
+        with self.assertRaises(TypeError):
+            utils._count_generic(42, 1)
+        with self.assertRaises(ZeroDivisionError):
+            utils._count_generic((1 // x for x in (1, 0)), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
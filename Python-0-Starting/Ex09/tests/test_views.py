@@ -0,0 +1,68 @@
+"""
+Test suite for ft_package.views module.
+"""
+
+import unittest
+from array import array
+from ft_package import ReversedView, reverse_list, reversed_view
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestReversedView(unittest.TestCase):
+    """Test cases for reversed_view."""
+
+    def test_matches_reverse_list(self):
+        """Test that the view reads like reverse_list's copy."""
+        for items in [["a", "b", "c"], [], (1, 2, 3, 4), "abc",
+                      array("i", [1, 2, 3]), range(10)]:
+            view = reversed_view(items)
+            self.assertIsInstance(view, ReversedView)
+            self.assertEqual(list(view), list(reverse_list(items)))
+            self.assertEqual(view.materialize(), list(reverse_list(items)))
+            self.assertEqual(len(view), len(items))
+
+    def test_indexing_and_slicing(self):
+        """Test indexing and slicing, which must not copy."""
+        items = list(range(10))
+        view = reversed_view(items)
+        self.assertEqual(view[0], 9)
+        self.assertEqual(view[-1], 0)
+        with self.assertRaises(IndexError):
+            view[10]
+        part = view[2:8:2]
+        self.assertIsInstance(part, ReversedView)
+        self.assertEqual(list(part), [7, 5, 3])
+        self.assertEqual(list(reversed(part)), [3, 5, 7])
+        self.assertEqual(list(view[::-1]), items)
+        self.assertEqual(view.index(7), 2)
+        self.assertIn(3, view)
+
+    def test_zero_copy(self):
+        """Test that element changes show through the view."""
+        items = [1, 2, 3]
+        view = reversed_view(items)
+        items[0] = 42
+        self.assertEqual(view[-1], 42)
+
+    def test_not_a_sequence(self):
+        """Test that non-sequences are rejected."""
+        with self.assertRaises(TypeError):
+            reversed_view({"a": 1})
+        with self.assertRaises(TypeError):
+            reversed_view(iter([1, 2]))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_ndarray_view(self):
+        """Test that ndarrays get a negative-stride view."""
+        values = np.arange(5)
+        view = reversed_view(values)
+        self.assertEqual(view.tolist(), [4, 3, 2, 1, 0])
+        self.assertTrue(np.shares_memory(view, values))
+
+
+if __name__ == "__main__":
+    unittest.main()
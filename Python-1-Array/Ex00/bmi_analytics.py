@@ -0,0 +1,285 @@
+"""
+bmi_analytics.py
+
+Module to aggregate BMI values by cohort: counts above several limits,
+mean, standard deviation, min/max, histograms and percentiles per group.
+
+The inputs are columnar arrays (heights, weights and one integer key per
+grouping column, e.g. age band and region). All the aggregates of a chunk
+are computed while it is in memory, with np.bincount on the combined group
+index and no sorting. Aggregates of separate chunks merge exactly, so data
+bigger than memory is processed chunk by chunk.
+"""
+
+from typing import Iterable, Sequence, Tuple, Union
+
+import numpy as np
+
+# Histogram bin edges, 0.1 BMI wide; values outside go to the first or
+# the last bin.
+BIN_EDGES = np.round(np.arange(10.0, 60.05, 0.1), 1)
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+
+def age_bands(ages: ArrayLike, edges: Sequence[float]) -> np.ndarray:
+    """
+    Turn ages into age band keys.
+
+    Args:
+        ages (ArrayLike): Ages in years.
+        edges (Sequence[float]): Increasing band limits, e.g. [18, 30, 45,
+            65] for the bands <18, 18-29, 30-44, 45-64 and 65+.
+
+    Returns:
+        np.ndarray: Band index of every age, from 0 to len(edges).
+    """
+    return np.searchsorted(np.asarray(edges), np.asarray(ages), side="right")
+
+
+class CohortStats:
+    """
+    BMI aggregates of every group, mergeable across chunks.
+
+    Groups are all the combinations of the key columns, numbered in C order
+    (the last key varies fastest); statistics are arrays indexed by group,
+    and reshape(group_sizes) gives them one axis per key.
+    """
+
+    def __init__(self, group_sizes: Sequence[int], limits: Sequence[float],
+                 bin_edges: np.ndarray = BIN_EDGES) -> None:
+        """
+        Create empty aggregates.
+
+        Args:
+            group_sizes (Sequence[int]): Number of values of each key.
+            limits (Sequence[float]): BMI limits counted by count_above.
+            bin_edges (np.ndarray): Increasing histogram bin edges.
+
+        Raises:
+            ValueError: If a size is not positive or the limits are not
+                increasing (or are NaN).
+        """
+        if any(size <= 0 for size in group_sizes):
+            raise ValueError("Group sizes must be positive.")
+        self.group_sizes = tuple(group_sizes)
+        self.limits = np.asarray(limits, dtype=float)
+        if np.any(np.isnan(self.limits)) or np.any(np.diff(self.limits) <= 0):
+            raise ValueError("Limits must be increasing.")
+        self.bin_edges = np.asarray(bin_edges, dtype=float)
+        groups = int(np.prod(self.group_sizes))
+        self.count = np.zeros(groups, dtype=np.int64)
+        self.total = np.zeros(groups)
+        self.total_squares = np.zeros(groups)
+        self.minimum = np.full(groups, np.inf)
+        self.maximum = np.full(groups, -np.inf)
+        # Per group, number of values above exactly k of the limits
+        self._levels = np.zeros((groups, len(self.limits) + 1),
+                                dtype=np.int64)
+        self.histogram = np.zeros((groups, len(self.bin_edges) - 1),
+                                  dtype=np.int64)
+
+    @property
+    def groups(self) -> int:
+        """Number of groups."""
+        return len(self.count)
+
+    def update(self, height: ArrayLike, weight: ArrayLike,
+               *keys: ArrayLike) -> "CohortStats":
+        """
+        Add a chunk of people to the aggregates, in one pass.
+
+        Args:
+            height (ArrayLike): Heights in meters.
+            weight (ArrayLike): Weights in kilograms.
+            *keys (ArrayLike): One integer key per grouping column, each
+                between 0 and its group size - 1.
+
+        Returns:
+            CohortStats: self, updated.
+
+        Raises:
+            TypeError: If the values are not numeric.
+            ValueError: If the columns have different lengths, a height or
+                weight is not a finite positive number (NaN included), or a
+                key is out of range.
+        """
+        try:
+            height = np.asarray(height, dtype=float)
+            weight = np.asarray(weight, dtype=float)
+        except ValueError:
+            raise TypeError("Heights and weights must be numbers.")
+        if len(keys) != len(self.group_sizes):
+            raise ValueError(f"{len(self.group_sizes)} key columns expected.")
+        if any(np.shape(column) != height.shape
+               for column in (weight,) + keys):
+            raise ValueError("All columns must have the same length.")
+        if not (np.all(np.isfinite(height)) and np.all(np.isfinite(weight))):
+            raise ValueError(
+                "Heights and weights must not be NaN or infinite.")
+        if np.any(height <= 0) or np.any(weight <= 0):
+            raise ValueError(
+                "All height and weight values must be positive numbers.")
+        try:
+            group = np.ravel_multi_index(keys, self.group_sizes)
+        except (TypeError, ValueError):
+            raise ValueError("Keys must be integers within the group sizes.")
+
+        bmi = weight / height ** 2
+        groups = self.groups
+        self.count += np.bincount(group, minlength=groups)
+        self.total += np.bincount(group, weights=bmi, minlength=groups)
+        self.total_squares += np.bincount(group, weights=bmi * bmi,
+                                          minlength=groups)
+        np.minimum.at(self.minimum, group, bmi)
+        np.maximum.at(self.maximum, group, bmi)
+
+        levels = len(self.limits) + 1
+        above = np.searchsorted(self.limits, bmi, side="left")
+        self._levels += np.bincount(group * levels + above,
+                                    minlength=groups * levels
+                                    ).reshape(groups, levels)
+
+        bins = len(self.bin_edges) - 1
+        index = np.searchsorted(self.bin_edges, bmi, side="right") - 1
+        np.clip(index, 0, bins - 1, out=index)
+        self.histogram += np.bincount(group * bins + index,
+                                      minlength=groups * bins
+                                      ).reshape(groups, bins)
+        return self
+
+    def merge(self, other: "CohortStats") -> "CohortStats":
+        """
+        Combine the aggregates of two chunks.
+
+        Args:
+            other (CohortStats): Aggregates with the same groups, limits and
+                bins.
+
+        Returns:
+            CohortStats: The aggregates of both chunks.
+
+        Raises:
+            ValueError: If the aggregates are not compatible.
+        """
+        if (self.group_sizes != other.group_sizes
+                or not np.array_equal(self.limits, other.limits)
+                or not np.array_equal(self.bin_edges, other.bin_edges)):
+            raise ValueError("Only aggregates of the same layout can merge.")
+        merged = CohortStats(self.group_sizes, self.limits, self.bin_edges)
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        merged.total_squares = self.total_squares + other.total_squares
+        merged.minimum = np.minimum(self.minimum, other.minimum)
+        merged.maximum = np.maximum(self.maximum, other.maximum)
+        merged._levels = self._levels + other._levels
+        merged.histogram = self.histogram + other.histogram
+        return merged
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Tuple[ArrayLike, ...]],
+                    group_sizes: Sequence[int],
+                    limits: Sequence[float]) -> "CohortStats":
+        """
+        Aggregate data read chunk by chunk, e.g. from files too big for RAM.
+
+        Args:
+            chunks (Iterable[Tuple[ArrayLike, ...]]): (height, weight,
+                *keys) column tuples.
+            group_sizes (Sequence[int]): Number of values of each key.
+            limits (Sequence[float]): BMI limits counted by count_above.
+
+        Returns:
+            CohortStats: The aggregates of all the chunks.
+        """
+        stats = cls(group_sizes, limits)
+        for chunk in chunks:
+            stats.update(*chunk)
+        return stats
+
+    @property
+    def count_above(self) -> np.ndarray:
+        """Number of BMI values strictly above each limit, shape (G, L)."""
+        return self._levels[:, :0:-1].cumsum(axis=1)[:, ::-1]
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Mean BMI of each group (NaN for empty groups)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.total / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        """Standard deviation of the BMI of each group."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variance = self.total_squares / self.count - self.mean ** 2
+        return np.sqrt(np.maximum(variance, 0))
+
+    def percentile(self, q: float) -> np.ndarray:
+        """
+        Estimate a BMI percentile of each group from its histogram.
+
+        The value is interpolated linearly inside the bin holding the rank,
+        so it is exact to the bin width (0.1 by default).
+
+        Args:
+            q (float): The percentile, between 0 and 100.
+
+        Returns:
+            np.ndarray: The percentile of each group (NaN for empty groups).
+
+        Raises:
+            ValueError: If q is out of range.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        cumulative = self.histogram.cumsum(axis=1)
+        rank = q / 100 * self.count
+        index = (cumulative < rank[:, None]).sum(axis=1)
+        index = np.minimum(index, self.histogram.shape[1] - 1)
+        rows = np.arange(self.groups)
+        before = cumulative[rows, index] - self.histogram[rows, index]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = (rank - before) / self.histogram[rows, index]
+        fraction = np.nan_to_num(fraction, nan=0.0)
+        low, high = self.bin_edges[index], self.bin_edges[index + 1]
+        value = low + np.clip(fraction, 0, 1) * (high - low)
+        value = np.clip(value, self.minimum, self.maximum)
+        return np.where(self.count > 0, value, np.nan)
+
+
+def main() -> None:
+    """
+    Main function to demonstrate the analytics on a synthetic population.
+    """
+    try:
+        rng = np.random.default_rng(0)
+        size = 1_000_000
+        ages = rng.integers(18, 90, size)
+        regions = rng.integers(0, 4, size)
+        height = rng.normal(1.72, 0.09, size).clip(1.3, 2.2)
+        weight = rng.normal(75, 14, size).clip(35, 200)
+
+        bands = age_bands(ages, [30, 45, 65])
+        stats = CohortStats((4, 4), limits=[18.5, 25, 30])
+        for start in range(0, size, 250_000):
+            chunk = slice(start, start + 250_000)
+            stats.update(height[chunk], weight[chunk],
+                         bands[chunk], regions[chunk])
+
+        median = stats.percentile(50)
+        print("band region   count   mean  median  >18.5  >25  >30")
+        for group in np.flatnonzero(stats.count):
+            band, region = np.unravel_index(group, stats.group_sizes)
+            above = stats.count_above[group]
+            print(f"{band:>4} {region:>6} {stats.count[group]:>7} "
+                  f"{stats.mean[group]:>6.2f} "
+                  f"{median[group]:>7.2f} {above[0]:>6} {above[1]:>4} "
+                  f"{above[2]:>4}")
+    except (TypeError, ValueError) as error:
+        print(f"Error: {error}")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
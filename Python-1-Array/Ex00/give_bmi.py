@@ -5,9 +5,14 @@ Module to calculate BMI values and apply a limit to determine
 if they are above the threshold.
 """
 
-from typing import List, Union
+from typing import List, Sequence, Tuple, Union
 import numpy as np
 
+# WHO adult BMI categories and the limits between them: a BMI equal to a
+# limit belongs to the category above it.
+WHO_THRESHOLDS = (18.5, 25.0, 30.0)
+WHO_CATEGORIES = ("underweight", "normal", "overweight", "obese")
+
 
 def give_bmi(height: List[Union[int, float]],
              weight: List[Union[int, float]]) -> List[float]:
@@ -54,41 +59,110 @@ def give_bmi(height: List[Union[int, float]],
     return bmi_array.tolist()
 
 
-def apply_limit(bmi: List[Union[int, float]],
-                limit: Union[int, float]) -> List[bool]:
+def _to_bmi_array(bmi: Union[List[Union[int, float]], np.ndarray]
+                  ) -> np.ndarray:
+    """
+    Validate BMI values and convert them to a float array.
+
+    Args:
+        bmi (Union[List[Union[int, float]], np.ndarray]): BMI values.
+
+    Returns:
+        np.ndarray: The values as a float array.
+
+    Raises:
+        TypeError: If bmi is not a list or array of numbers.
+    """
+    # Validate input types
+    if not isinstance(bmi, (list, np.ndarray)):
+        raise TypeError("BMI must be a list.")
+
+    # Convert bmi list to NumPy array for efficient computation
+    try:
+        return np.asarray(bmi, dtype=float)
+    except (TypeError, ValueError):
+        raise TypeError("All elements in BMI list must be integers or floats.")
+
+
+def apply_limit(bmi: Union[List[Union[int, float]], np.ndarray],
+                limit: Union[int, float],
+                packed: bool = False) -> Union[List[bool], np.ndarray]:
     """
     Determine if each BMI value is above the specified limit.
 
     Args:
-        bmi (List[Union[int, float]]): List of BMI values.
+        bmi (Union[List[Union[int, float]], np.ndarray]): List of BMI
+            values; a NumPy array is accepted too.
         limit (Union[int, float]): BMI threshold.
+        packed (bool): Return the flags bit-packed with np.packbits, 8 per
+            byte, instead of a list of booleans. np.unpackbits(flags,
+            count=len(bmi)).astype(bool) restores them.
 
     Returns:
-        List[bool]: List indicating whether each BMI is above the limit.
+        Union[List[bool], np.ndarray]: List indicating whether each BMI is
+        above the limit, or the packed uint8 array.
 
     Raises:
         TypeError: If bmi is not a list or contains non-numeric values
         , or if limit is not numeric.
     """
-    # Validate input types
-    if not isinstance(bmi, list):
-        raise TypeError("BMI must be a list.")
+    bmi_array = _to_bmi_array(bmi)
 
     if not isinstance(limit, (int, float)):
         raise TypeError("Limit must be an integer or float.")
 
-    # Convert bmi list to NumPy array for efficient computation
-    try:
-        bmi_array = np.array(bmi, dtype=float)
-    except ValueError:
-        raise TypeError("All elements in BMI list must be integers or floats.")
-
     # Determine if each BMI value is above the limit
     above_limit = bmi_array > limit
 
+    if packed:
+        return np.packbits(above_limit)
     return above_limit.tolist()
 
 
+def classify_bmi(bmi: Union[List[Union[int, float]], np.ndarray],
+                 thresholds: Sequence[Union[int, float]] = WHO_THRESHOLDS
+                 ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort BMI values into the categories delimited by several thresholds.
+
+    The code of a value is the number of thresholds at or below it, found
+    for every value in a single np.searchsorted pass over the thresholds.
+    NaN values belong to no category and are rejected.
+
+    Args:
+        bmi (Union[List[Union[int, float]], np.ndarray]): BMI values, of any
+            shape.
+        thresholds (Sequence[Union[int, float]]): Increasing limits between
+            categories; defaults to the WHO ones (see WHO_CATEGORIES).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The int8 category code of every
+        value, from 0 to len(thresholds), with the shape of bmi, and the
+        number of values in each category.
+
+    Raises:
+        TypeError: If bmi or thresholds are not numeric.
+        ValueError: If a value is NaN, or if the thresholds are not
+        increasing or too many for int8 codes.
+    """
+    bmi_array = _to_bmi_array(bmi)
+    try:
+        limits = np.asarray(thresholds, dtype=float)
+    except (TypeError, ValueError):
+        raise TypeError("Thresholds must be integers or floats.")
+    if limits.ndim != 1 or np.isnan(limits).any() \
+            or not np.all(np.diff(limits) > 0):
+        raise ValueError("Thresholds must be a list of increasing values.")
+    if len(limits) > np.iinfo(np.int8).max:
+        raise ValueError("Too many thresholds for int8 category codes.")
+    if np.isnan(bmi_array).any():
+        raise ValueError("BMI values must not be NaN.")
+
+    codes = np.searchsorted(limits, bmi_array, side="right").astype(np.int8)
+    counts = np.bincount(codes.ravel(), minlength=len(limits) + 1)
+    return codes, counts
+
+
 def main() -> None:
     """
     Main function to demonstrate the usage of give_bmi
@@ -111,6 +185,11 @@ def main() -> None:
         bmi_above_limit = apply_limit(bmi, limit)
         print(bmi_above_limit)
 
+        # Classify into the WHO categories
+        codes, counts = classify_bmi(bmi)
+        print([WHO_CATEGORIES[code] for code in codes],
+              dict(zip(WHO_CATEGORIES, counts.tolist())))
+
     except (TypeError, ValueError) as error:
         print(f"Error: {error}")
         exit(1)
@@ -1,6 +1,7 @@
 # tester.py
 
-from give_bmi import give_bmi, apply_limit
+from bmi_analytics import CohortStats
+from give_bmi import give_bmi, apply_limit, classify_bmi
 
 
 def main():
@@ -15,9 +16,26 @@ def main():
         bmi_limit = apply_limit(bmi, 26)
         print(bmi_limit)
 
+        codes, counts = classify_bmi(bmi)
+        print(codes, counts)
+
     except (TypeError, ValueError) as e:
         print(f"Error: {e}")
 
+    # Values of any shape are classified; NaN belongs to no category
+    codes, counts = classify_bmi([[20.0, 30.0], [18.0, 40.0]])
+    print(codes, counts)
+    try:
+        classify_bmi([22.5, float("nan")])
+    except ValueError as e:
+        print(f"Error: {e}")
+
+    # Cohort aggregates reject NaN too, instead of counting it above limits
+    try:
+        CohortStats([1], [25.0]).update([1.8, float("nan")], [70, 70], [0, 0])
+    except ValueError as e:
+        print(f"Error: {e}")
+
 
 if __name__ == "__main__":
     main()
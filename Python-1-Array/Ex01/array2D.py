@@ -3,37 +3,135 @@ array2D.py
 
 Module to handle 2D array operations,
 including slicing and shape determination.
+
+Besides nested lists, the 2D array can be an ndarray or a memmap, or the
+path to a .npy or .csv file, so that windows of datasets bigger than
+memory can be sliced or streamed in blocks of rows.
 """
 
-from typing import List, Union
+import itertools
+import os
+from typing import Iterator, List, Optional, Tuple, Union
 import numpy as np
 
+# Rows per block yielded by slice_blocks.
+BLOCK_ROWS = 65536
 
-def slice_me(
-    family: List[List[Union[int, float]]], start: int, end: int
-) -> List[List[Union[int, float]]]:
+# Everything slice_me accepts as the 2D array.
+Source = Union[List[List[Union[int, float]]], np.ndarray, str]
+
+
+def _open_source(family: Source) -> Source:
     """
-    Slice a 2D array based on start and end indices
-    and return the truncated array.
+    Open a .npy path as a read-only memmap; pass other sources through.
 
-    This function prints the original shape of the array,
-    slices it using the provided
-    start and end indices, prints the new shape of the truncated array,
-    and returns
-    the sliced array.
+    Args:
+        family (Source): Nested lists, an ndarray, or a file path.
+
+    Returns:
+        Source: A memmap for .npy files, the path for .csv files, family
+        itself otherwise.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is neither .npy nor .csv.
+    """
+    if not isinstance(family, str):
+        return family
+    if not os.path.isfile(family):
+        raise FileNotFoundError(f"The file '{family}' does not exist.")
+    if family.lower().endswith(".npy"):
+        return np.load(family, mmap_mode="r")
+    if family.lower().endswith(".csv"):
+        return family
+    raise ValueError("Only .npy and .csv files can be sliced.")
+
+
+def _csv_shape(path: str) -> Tuple[int, int]:
+    """
+    Count the rows and columns of a numeric CSV file without loading it.
+
+    Rows are counted by reading the file sequentially in 1 MiB chunks.
+
+    Args:
+        path (str): Path to the CSV file.
+
+    Returns:
+        Tuple[int, int]: The number of rows and of columns.
+    """
+    rows, last = 0, b"\n"
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            rows += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        rows += 1
+    return rows, _csv_width(path)
+
+
+def _csv_width(path: str) -> int:
+    """Return the number of columns of a CSV file, from its first line."""
+    with open(path, "rb") as file:
+        return file.readline().count(b",") + 1
+
+
+def _read_csv_rows(lines: Iterator[str], width: int,
+                   columns: slice) -> np.ndarray:
+    """
+    Parse CSV lines into a 2D float array and keep the given columns.
+
+    Args:
+        lines (Iterator[str]): The CSV lines.
+        width (int): Number of columns of the file.
+        columns (slice): Columns to keep.
+
+    Returns:
+        np.ndarray: The parsed rows.
+    """
+    lines = list(lines)
+    if not lines:
+        return np.empty((0, width))[:, columns]
+    return np.loadtxt(lines, delimiter=",", dtype=float, ndmin=2)[:, columns]
+
+
+def _validate_indices(start: int, end: int,
+                      columns: Optional[slice]) -> slice:
+    """
+    Check the slicing arguments.
 
     Args:
-        family (List[List[Union[int, float]]]): The 2D array to be sliced.
         start (int): The starting index for slicing.
         end (int): The ending index for slicing.
+        columns (Optional[slice]): Columns to keep, or None for all.
+
+    Returns:
+        slice: The columns to keep.
+
+    Raises:
+        TypeError: If start/end are not integers or columns is not a slice.
+    """
+    if not isinstance(start, int) or not isinstance(end, int):
+        raise TypeError("The 'start' and 'end' parameters must be integers.")
+    if columns is None:
+        return slice(None)
+    if not isinstance(columns, slice):
+        raise TypeError("The 'columns' parameter must be a slice.")
+    return columns
+
+
+def _validate_lists(family: List[List[Union[int, float]]]) -> np.ndarray:
+    """
+    Check that family is a rectangular list of lists of numbers.
+
+    Args:
+        family (List[List[Union[int, float]]]): The 2D array.
 
     Returns:
-        List[List[Union[int, float]]]: The truncated 2D array after slicing.
+        np.ndarray: family as a NumPy array.
 
     Raises:
         TypeError: If 'family' is not a list of lists containing integers
-        or floats,
-                   or if 'start'/'end' are not integers.
+        or floats.
         ValueError: If the inner lists in 'family' are not of the same length.
     """
     # Validate that 'family' is a list
@@ -56,18 +154,80 @@ def slice_me(
             "All inner lists in 'family' must have the same length."
             )
 
-    # Validate that 'start' and 'end' are integers
-    if not isinstance(start, int) or not isinstance(end, int):
-        raise TypeError("The 'start' and 'end' parameters must be integers.")
-
     # Convert the list of lists to a NumPy array for efficient slicing
-    array = np.array(family)
+    return np.array(family)
+
+
+def slice_me(
+    family: Source, start: int, end: int, columns: Optional[slice] = None
+) -> Union[List[List[Union[int, float]]], np.ndarray]:
+    """
+    Slice a 2D array based on start and end indices
+    and return the truncated array.
+
+    This function prints the original shape of the array,
+    slices it using the provided
+    start and end indices, prints the new shape of the truncated array,
+    and returns
+    the sliced array.
+
+    .npy files are memory-mapped, so only the sliced rows are ever read;
+    CSV files are scanned once to count their rows and only the sliced rows
+    are parsed.
+
+    Args:
+        family (Source): The 2D array to be sliced: a list of lists, an
+            ndarray or memmap, or the path to a .npy or .csv file.
+        start (int): The starting index for slicing.
+        end (int): The ending index for slicing.
+        columns (Optional[slice]): Columns to keep, with an optional step
+            (e.g. slice(0, None, 2)); all of them by default.
+
+    Returns:
+        Union[List[List[Union[int, float]]], np.ndarray]: The truncated 2D
+        array after slicing: a list of lists for list input, a view for
+        arrays and .npy files, a new float array for CSV files.
+
+    Raises:
+        TypeError: If 'family' is not a list of lists containing integers
+        or floats,
+                   or if 'start'/'end' are not integers.
+        ValueError: If the inner lists in 'family' are not of the same length,
+        or if an array is not 2D.
+        FileNotFoundError: If the file does not exist.
+    """
+    family = _open_source(family)
+    if isinstance(family, str):
+        columns = _validate_indices(start, end, columns)
+        shape = _csv_shape(family)
+        print(f"My shape is : {shape}")
+        first, last, _ = slice(start, end).indices(shape[0])
+        with open(family) as file:
+            sliced_array = _read_csv_rows(
+                itertools.islice(file, first, max(first, last)),
+                shape[1], columns)
+        print(f"My new shape is : {sliced_array.shape}")
+        return sliced_array
+
+    if isinstance(family, np.ndarray):
+        columns = _validate_indices(start, end, columns)
+        if family.ndim != 2:
+            raise ValueError("The array must be 2D.")
+        print(f"My shape is : {family.shape}")
+        sliced_array = family[start:end, columns]
+        print(f"My new shape is : {sliced_array.shape}")
+        return sliced_array
+
+    array = _validate_lists(family)
+
+    # Validate that 'start' and 'end' are integers
+    columns = _validate_indices(start, end, columns)
 
     # Print the original shape of the array
     print(f"My shape is : {array.shape}")
 
     # Perform slicing using the provided 'start' and 'end' indices
-    sliced_array = array[start:end]
+    sliced_array = array[start:end, columns]
 
     # Print the new shape of the sliced array
     print(f"My new shape is : {sliced_array.shape}")
@@ -76,6 +236,62 @@ def slice_me(
     return sliced_array.tolist()
 
 
+def slice_blocks(
+    family: Source, start: int, end: int, columns: Optional[slice] = None,
+    block_rows: int = BLOCK_ROWS
+) -> Iterator[np.ndarray]:
+    """
+    Stream the rows start:end of a 2D array in blocks.
+
+    Only one block is in memory at a time: blocks of arrays and .npy files
+    are views, blocks of CSV files are parsed from the file as they are
+    requested (the file is only scanned beforehand to count its rows when
+    start or end is negative). Nothing is printed.
+
+    Args:
+        family (Source): The 2D array: a list of lists, an ndarray or
+            memmap, or the path to a .npy or .csv file.
+        start (int): The starting index for slicing.
+        end (int): The ending index for slicing.
+        columns (Optional[slice]): Columns to keep, all of them by default.
+        block_rows (int): Maximum number of rows per block.
+
+    Yields:
+        np.ndarray: Consecutive blocks of the sliced rows.
+
+    Raises:
+        TypeError: If the arguments have the wrong types.
+        ValueError: If block_rows is not positive or an array is not 2D.
+        FileNotFoundError: If the file does not exist.
+    """
+    columns = _validate_indices(start, end, columns)
+    if block_rows <= 0:
+        raise ValueError("The 'block_rows' parameter must be positive.")
+    family = _open_source(family)
+    if isinstance(family, str):
+        # The rows only need counting to resolve negative indices
+        if start >= 0 and end >= 0:
+            first, last, width = start, end, _csv_width(family)
+        else:
+            rows, width = _csv_shape(family)
+            first, last, _ = slice(start, end).indices(rows)
+        with open(family) as file:
+            lines = itertools.islice(file, first, max(first, last))
+            while True:
+                block = _read_csv_rows(itertools.islice(lines, block_rows),
+                                       width, columns)
+                if not len(block):
+                    return
+                yield block
+    if not isinstance(family, np.ndarray):
+        family = _validate_lists(family)
+    if family.ndim != 2:
+        raise ValueError("The array must be 2D.")
+    first, last, _ = slice(start, end).indices(len(family))
+    for row in range(first, last, block_rows):
+        yield family[row:min(row + block_rows, last), columns]
+
+
 def main() -> None:
     """
     Main function to demonstrate the usage of the 'slice_me' function.
@@ -0,0 +1,244 @@
+"""
+pyramid.py
+
+Module to build an image pyramid (mipmap) of successive 2x downsampled
+levels, store it alongside the source image, and zoom from the smallest
+level that still gives the requested output resolution.
+
+A zoomed-out view of a huge image then reads a few times the number of
+output pixels instead of every pixel of the viewed area.
+"""
+
+import struct
+import sys
+import time
+import zipfile
+from typing import BinaryIO, List, Sequence, Tuple, Union
+
+import numpy as np
+from load_image import ft_load
+
+# Suffix of the pyramid file stored next to the source image.
+PYRAMID_SUFFIX = ".pyramid.npz"
+
+
+def downsample(image: np.ndarray) -> np.ndarray:
+    """
+    Halve the size of an image by averaging every 2x2 block of pixels.
+
+    The four pixels of each block are summed in a uint16 accumulator and
+    rounded back to uint8, without float temporaries. An odd last row or
+    column is dropped.
+
+    Args:
+        image (np.ndarray): A uint8 image of shape (H, W) or (H, W, C).
+
+    Returns:
+        np.ndarray: The downsampled image of shape (H // 2, W // 2[, C]).
+
+    Raises:
+        ValueError: If the image is not uint8 or smaller than 2x2.
+    """
+    if image.dtype != np.uint8:
+        raise ValueError("Only uint8 images can be downsampled.")
+    height, width = image.shape[0] // 2 * 2, image.shape[1] // 2 * 2
+    if height == 0 or width == 0:
+        raise ValueError("Image too small to be downsampled.")
+    total = image[0:height:2, 0:width:2].astype(np.uint16)
+    total += image[1:height:2, 0:width:2]
+    total += image[0:height:2, 1:width:2]
+    total += image[1:height:2, 1:width:2]
+    total += 2
+    total >>= 2
+    return total.astype(np.uint8)
+
+
+def build_pyramid(image: np.ndarray, min_size: int = 1) -> List[np.ndarray]:
+    """
+    Build the pyramid of an image.
+
+    Args:
+        image (np.ndarray): The full-resolution uint8 image, level 0.
+        min_size (int): Levels stop before either side gets below this.
+
+    Returns:
+        List[np.ndarray]: The levels, each half the size of the previous one.
+    """
+    levels = [image]
+    while min(levels[-1].shape[:2]) // 2 >= max(min_size, 1):
+        levels.append(downsample(levels[-1]))
+    return levels
+
+
+def pyramid_path(image_path: str) -> str:
+    """
+    Return the path of the pyramid file stored alongside an image.
+
+    Args:
+        image_path (str): Path to the source image.
+
+    Returns:
+        str: The path of its pyramid file.
+    """
+    return image_path + PYRAMID_SUFFIX
+
+
+def save_pyramid(levels: List[np.ndarray], path: str) -> None:
+    """
+    Store all the levels of a pyramid in a single .npz file.
+
+    Args:
+        levels (List[np.ndarray]): The pyramid levels.
+        path (str): The file to write.
+    """
+    arrays = {f"level_{index}": level for index, level in enumerate(levels)}
+    np.savez(path, **arrays)
+
+
+class Pyramid:
+    """
+    Pyramid levels memory-mapped from a .npz file.
+
+    np.savez stores every level uncompressed, so each one is mapped in place
+    and a view only reads the pixels it covers: opening a pyramid and
+    zooming into it does not depend on the size of the full-resolution
+    image.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a pyramid file.
+
+        Args:
+            path (str): The .npz file written by save_pyramid.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not an uncompressed pyramid.
+        """
+        with zipfile.ZipFile(path) as archive:
+            members = {info.filename: info for info in archive.infolist()}
+        self._levels = []
+        with open(path, "rb") as file:
+            while f"level_{len(self._levels)}.npy" in members:
+                info = members[f"level_{len(self._levels)}.npy"]
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError("Compressed pyramid levels can't be "
+                                     "memory-mapped.")
+                self._levels.append(self._map_member(path, file, info))
+        if not self._levels:
+            raise ValueError(f"No pyramid levels in '{path}'.")
+
+    @staticmethod
+    def _map_member(path: str, file: BinaryIO,
+                    info: zipfile.ZipInfo) -> np.ndarray:
+        """Memory-map the array stored in one uncompressed zip member."""
+        # Local file header: 30 bytes, then the file name and extra field
+        file.seek(info.header_offset + 26)
+        name_length, extra_length = struct.unpack("<HH", file.read(4))
+        file.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(file)
+        else:
+            header = np.lib.format.read_array_header_2_0(file)
+        shape, fortran_order, dtype = header
+        return np.memmap(path, dtype=dtype, mode="r", offset=file.tell(),
+                         shape=shape, order="F" if fortran_order else "C")
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._levels[index]
+
+
+def select_level(region: Tuple[int, int], output: Tuple[int, int],
+                 count: int) -> int:
+    """
+    Pick the smallest level still giving the requested output resolution.
+
+    Args:
+        region (Tuple[int, int]): Width and height of the viewed area, in
+            full-resolution pixels.
+        output (Tuple[int, int]): Requested output width and height.
+        count (int): Number of levels of the pyramid.
+
+    Returns:
+        int: The index of the level to read.
+    """
+    level = 0
+    while level + 1 < count and all(
+            size >> (level + 1) >= wanted
+            for size, wanted in zip(region, output)):
+        level += 1
+    return level
+
+
+def zoom_pyramid(levels: Union[Sequence[np.ndarray], Pyramid],
+                 start_x: int, end_x: int,
+                 start_y: int, end_y: int,
+                 out_width: int, out_height: int) -> np.ndarray:
+    """
+    Zoom into an area of the image, reading the smallest suitable level.
+
+    The result covers the requested full-resolution area and is at least
+    out_width x out_height pixels (unless the area itself is smaller), and
+    less than twice that on at least one side.
+
+    Args:
+        levels (Union[Sequence[np.ndarray], Pyramid]): The pyramid levels.
+        start_x (int): Start index on the X-axis, at full resolution.
+        end_x (int): End index on the X-axis, at full resolution.
+        start_y (int): Start index on the Y-axis, at full resolution.
+        end_y (int): End index on the Y-axis, at full resolution.
+        out_width (int): Requested output width.
+        out_height (int): Requested output height.
+
+    Returns:
+        np.ndarray: The zoomed portion of the selected level.
+
+    Raises:
+        ValueError: If the area or the output size is empty.
+    """
+    if end_x <= start_x or end_y <= start_y:
+        raise ValueError("The zoomed area is empty.")
+    if out_width <= 0 or out_height <= 0:
+        raise ValueError("The output size must be positive.")
+    level = select_level((end_x - start_x, end_y - start_y),
+                         (out_width, out_height), len(levels))
+    scale = 1 << level
+    return levels[level][start_y // scale:-(-end_y // scale),
+                         start_x // scale:-(-end_x // scale)]
+
+
+def main() -> None:
+    """
+    Main function to build, store and use the pyramid of an image.
+
+    Usage: python pyramid.py [image]
+    """
+    try:
+        image_path = sys.argv[1] if len(sys.argv) > 1 else "animal.jpeg"
+        image = ft_load(image_path)
+
+        levels = build_pyramid(image)
+        save_pyramid(levels, pyramid_path(image_path))
+        print(f"Pyramid levels: {[level.shape for level in levels]}")
+
+        # Whole image in a 128x128 thumbnail, then a full-resolution detail
+        pyramid = Pyramid(pyramid_path(image_path))
+        height, width = image.shape[:2]
+        for area, output in (((0, width, 0, height), (128, 128)),
+                             ((450, 850, 100, 500), (400, 400))):
+            start = time.perf_counter()
+            view = zoom_pyramid(pyramid, *area, *output)
+            elapsed = time.perf_counter() - start
+            print(f"View {area} at {output}: shape {view.shape}, "
+                  f"{elapsed * 1000:.2f} ms")
+    except (OSError, TypeError, ValueError) as error:
+        print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,21 +8,33 @@ and save it automatically.
 import matplotlib.pyplot as plt
 import numpy as np
 from PIL import Image
+from grayscale import WEIGHTS, to_grayscale
 from load_image import ft_load
+from tiled_image import TiledImage
 
 
 def convert_to_grayscale(image: np.ndarray) -> np.ndarray:
     """
-    Convert an RGB image to grayscale.
+    Convert an RGB image to grayscale with the Rec.601 luma weights.
+
+    0.299 R + 0.587 G + 0.114 B is computed with the 8-bit fixed-point
+    weights of the grayscale engine, rounded: uint8 images go through the
+    engine, RGB images of other dtypes use the same weights in their own
+    dtype.
 
     Args:
         image (np.ndarray): The RGB image as a NumPy array.
 
     Returns:
         np.ndarray: Grayscale version of the image.
+
+    Raises:
+        ValueError: If the image is neither RGB nor grayscale.
     """
     if len(image.shape) == 3 and image.shape[2] == 3:  # If RGB
-        grayscale = np.dot(image[..., :3], [0.2989, 0.5870, 0.1140])
+        if image.dtype == np.uint8:
+            return to_grayscale(image, "rec601")
+        grayscale = (np.dot(image, WEIGHTS["rec601"]) + 128) // 256
         return grayscale.astype(np.uint8)
     elif len(image.shape) == 2:  # Already grayscale
         return image
@@ -62,6 +74,45 @@ def zoom_image(image: np.ndarray,
             )
 
 
+def convert_to_grayscale_tiled(image: TiledImage, path: str) -> TiledImage:
+    """
+    Convert a tiled RGB image to grayscale, tile by tile.
+
+    Args:
+        image (TiledImage): The RGB image, possibly bigger than RAM.
+        path (str): The pixel file of the grayscale tiled image.
+
+    Returns:
+        TiledImage: Grayscale version of the image.
+    """
+    return image.map_tiles(convert_to_grayscale, path, channels=1)
+
+
+def zoom_tiled(image: TiledImage,
+               start_x: int, end_x: int,
+               start_y: int, end_y: int, path: str) -> TiledImage:
+    """
+    Zoom into a specific area of a tiled image, tile by tile.
+
+    Args:
+        image (TiledImage): The original image, possibly bigger than RAM.
+        start_x (int): Start index on the X-axis for zooming.
+        end_x (int): End index on the X-axis for zooming.
+        start_y (int): Start index on the Y-axis for zooming.
+        end_y (int): End index on the Y-axis for zooming.
+        path (str): The pixel file of the zoomed tiled image.
+
+    Returns:
+        TiledImage: The zoomed portion of the image.
+
+    Raises:
+        ValueError: If the area is empty or outside the image.
+    """
+    zoomed_image = image.crop(start_y, end_y, start_x, end_x, path)
+    print(f"New shape after slicing: {zoomed_image.shape}")
+    return zoomed_image
+
+
 def display_zoomed_image(image: np.ndarray) -> None:
     """
     Display the zoomed grayscale image.
@@ -0,0 +1,198 @@
+"""
+grayscale.py
+
+Grayscale engine shared by the image exercises.
+
+Four modes are offered; `python grayscale.py` prints a table of their
+speed and error:
+
+* average: (R + G + B) / 3, rounded down;
+* rec601: 0.299 R + 0.587 G + 0.114 B (SD video luma, the weights used by
+  the exercises);
+* rec709: 0.2126 R + 0.7152 G + 0.0722 B (HD video / sRGB luma);
+* fast: (R + 2 G + B) / 4, a lossy shift-and-add approximation of luma,
+  rounded down.
+
+All modes use integer arithmetic: the luma weights are 8-bit fixed-point
+(summing to 256) and every mode accumulates in a uint16 buffer, so no
+float image is ever created. Rows are converted in blocks that stay in
+cache, directly into a 1- or 3-channel output buffer that may be
+preallocated.
+
+Like load_image.py, this file is copied unchanged into Ex03, Ex04 and Ex05.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+MODES = ("average", "rec601", "rec709", "fast")
+
+# 8-bit fixed-point weights of the luma modes, each summing to 256.
+WEIGHTS = {
+    "rec601": (77, 150, 29),
+    "rec709": (54, 183, 19),
+}
+
+# Exact float weights, used as the reference for the error of each mode.
+REFERENCE_WEIGHTS = {
+    "average": (1 / 3, 1 / 3, 1 / 3),
+    "rec601": (0.299, 0.587, 0.114),
+    "rec709": (0.2126, 0.7152, 0.0722),
+    "fast": (0.299, 0.587, 0.114),
+}
+
+# Rows converted at a time, so that the uint16 buffers stay in cache.
+BLOCK_ROWS = 64
+
+
+def _average(red: np.ndarray, green: np.ndarray, blue: np.ndarray,
+             total: np.ndarray, scratch: np.ndarray) -> None:
+    """Store (R + G + B) // 3 in total."""
+    np.add(red, green, out=total, dtype=np.uint16)
+    total += blue
+    total //= 3
+
+
+def _weighted(weights: Tuple[int, int, int]) -> Callable:
+    """Return the kernel storing the rounded weighted sum / 256 in total."""
+    weight_red, weight_green, weight_blue = weights
+
+    def kernel(red: np.ndarray, green: np.ndarray, blue: np.ndarray,
+               total: np.ndarray, scratch: np.ndarray) -> None:
+        np.multiply(red, weight_red, out=total, dtype=np.uint16)
+        np.multiply(green, weight_green, out=scratch, dtype=np.uint16)
+        total += scratch
+        np.multiply(blue, weight_blue, out=scratch, dtype=np.uint16)
+        total += scratch
+        total += 128
+        total >>= 8
+
+    return kernel
+
+
+def _fast(red: np.ndarray, green: np.ndarray, blue: np.ndarray,
+          total: np.ndarray, scratch: np.ndarray) -> None:
+    """Store (R + 2 G + B) >> 2 in total, with adds and a shift only."""
+    np.add(green, green, out=total, dtype=np.uint16)
+    total += red
+    total += blue
+    total >>= 2
+
+
+_KERNELS: Dict[str, Callable] = {
+    "average": _average,
+    "rec601": _weighted(WEIGHTS["rec601"]),
+    "rec709": _weighted(WEIGHTS["rec709"]),
+    "fast": _fast,
+}
+
+
+def to_grayscale(image: np.ndarray, mode: str = "rec601", channels: int = 1,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert an RGB image to grayscale.
+
+    Args:
+        image (np.ndarray): A uint8 image of shape (H, W, 3), or (H, W) if
+            already grayscale.
+        mode (str): One of MODES.
+        channels (int): 1 for an (H, W) result, 3 for an (H, W, 3) result
+            with the grey value repeated in each channel.
+        out (Optional[np.ndarray]): Preallocated uint8 buffer for the
+            result; a new array is returned if omitted.
+
+    Returns:
+        np.ndarray: The grayscale image (out, when given).
+
+    Raises:
+        ValueError: If the image format, mode, channels or out buffer is
+            not supported.
+    """
+    if mode not in _KERNELS:
+        raise ValueError(f"Unknown grayscale mode: {mode!r}.")
+    if channels not in (1, 3):
+        raise ValueError("Grayscale output must have 1 or 3 channels.")
+    if not isinstance(image, np.ndarray) or image.dtype != np.uint8 \
+            or not (image.ndim == 2
+                    or (image.ndim == 3 and image.shape[2] == 3)):
+        raise ValueError(
+            "Image format not supported for grayscale conversion.")
+    height, width = image.shape[:2]
+    shape = (height, width) if channels == 1 else (height, width, 3)
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    elif out.shape != shape or out.dtype != np.uint8:
+        raise ValueError(f"Output buffer must be uint8 of shape {shape}.")
+    grey = out if channels == 1 else out[..., 0]
+
+    if image.ndim == 2:
+        grey[...] = image
+    else:
+        kernel = _KERNELS[mode]
+        total = np.empty((min(BLOCK_ROWS, height), width), dtype=np.uint16)
+        scratch = np.empty_like(total)
+        for start in range(0, height, BLOCK_ROWS):
+            block = image[start:start + BLOCK_ROWS]
+            rows = len(block)
+            kernel(block[..., 0], block[..., 1], block[..., 2],
+                   total[:rows], scratch[:rows])
+            np.copyto(grey[start:start + rows], total[:rows],
+                      casting="unsafe")
+    if channels == 3:
+        out[..., 1] = grey
+        out[..., 2] = grey
+    return out
+
+
+def benchmark(image: np.ndarray,
+              repeat: int = 5) -> List[Tuple[str, float, float, float]]:
+    """
+    Measure the speed and the error of every mode on an RGB image.
+
+    The error is measured against the exact float formula of the mode;
+    "fast" is compared with Rec.601, which it approximates.
+
+    Args:
+        image (np.ndarray): A uint8 image of shape (H, W, 3).
+        repeat (int): Timing runs per mode, the fastest one is kept.
+
+    Returns:
+        List[Tuple[str, float, float, float]]: (mode, milliseconds, maximum
+        error, mean absolute error) rows, the float np.dot conversion
+        first.
+    """
+    out = np.empty(image.shape[:2], dtype=np.uint8)
+    rows = []
+    for mode in ("float dot",) + MODES:
+        weights = REFERENCE_WEIGHTS.get(mode, REFERENCE_WEIGHTS["rec601"])
+        reference = np.dot(image, weights)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            if mode == "float dot":
+                result = np.dot(image, weights).astype(np.uint8)
+            else:
+                result = to_grayscale(image, mode, out=out)
+            best = min(best, time.perf_counter() - start)
+        error = np.abs(result - reference)
+        rows.append((mode, best * 1000, float(error.max()),
+                     float(error.mean())))
+    return rows
+
+
+def main() -> None:
+    """
+    Print the speed vs error table of the grayscale modes on a 4K frame.
+    """
+    image = np.random.default_rng(0).integers(0, 256, (2160, 3840, 3),
+                                              dtype=np.uint8)
+    print(f"{'mode':<10} {'time (ms)':>10} {'max err':>8} {'mean err':>9}")
+    for mode, milliseconds, max_error, mean_error in benchmark(image):
+        print(f"{mode:<10} {milliseconds:>10.1f} {max_error:>8.2f} "
+              f"{mean_error:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,21 +7,33 @@ convert it to grayscale, manually transpose it, and display the result.
 
 import matplotlib.pyplot as plt
 import numpy as np
+from grayscale import WEIGHTS, to_grayscale
 from load_image import ft_load
+from tiled_image import TiledImage
 
 
 def convert_to_grayscale(image: np.ndarray) -> np.ndarray:
     """
-    Convert an RGB image to grayscale.
+    Convert an RGB image to grayscale with the Rec.601 luma weights.
+
+    0.299 R + 0.587 G + 0.114 B is computed with the 8-bit fixed-point
+    weights of the grayscale engine, rounded: uint8 images go through the
+    engine, RGB images of other dtypes use the same weights in their own
+    dtype.
 
     Args:
         image (np.ndarray): The RGB image as a NumPy array.
 
     Returns:
         np.ndarray: Grayscale version of the image.
+
+    Raises:
+        ValueError: If the image is neither RGB nor grayscale.
     """
-    if len(image.shape) == 3 and image.shape[2] == 3:
-        grayscale = np.dot(image[..., :3], [0.2989, 0.5870, 0.1140])
+    if len(image.shape) == 3 and image.shape[2] == 3:  # If RGB
+        if image.dtype == np.uint8:
+            return to_grayscale(image, "rec601")
+        grayscale = (np.dot(image, WEIGHTS["rec601"]) + 128) // 256
         return grayscale.astype(np.uint8)
     elif len(image.shape) == 2:  # Already grayscale
         return image
@@ -87,6 +99,37 @@ def transpose_image(image: np.ndarray) -> np.ndarray:
     return transposed
 
 
+def convert_to_grayscale_tiled(image: TiledImage, path: str) -> TiledImage:
+    """
+    Convert a tiled RGB image to grayscale, tile by tile.
+
+    Args:
+        image (TiledImage): The RGB image, possibly bigger than RAM.
+        path (str): The pixel file of the grayscale tiled image.
+
+    Returns:
+        TiledImage: Grayscale version of the image.
+    """
+    return image.map_tiles(convert_to_grayscale, path, channels=1)
+
+
+def transpose_tiled(image: TiledImage, path: str) -> TiledImage:
+    """
+    Transpose a tiled image, tile by tile.
+
+    Each tile is transposed in memory and written at the mirrored tile
+    position, so the image never has to fit in RAM.
+
+    Args:
+        image (TiledImage): The image to transpose, possibly bigger than RAM.
+        path (str): The pixel file of the transposed tiled image.
+
+    Returns:
+        TiledImage: The transposed image.
+    """
+    return image.transpose(path)
+
+
 def display_image(image: np.ndarray) -> None:
     """
     Display an image using matplotlib.
@@ -0,0 +1,250 @@
+"""
+image_stats.py
+
+Module to compute per-channel statistics of uint8 images: histograms,
+min/max, mean, standard deviation and percentiles.
+
+Everything is derived from one np.bincount histogram per channel, built in
+a single pass over the pixels. Histograms of separate tiles or threads add
+up, so partial results are merged instead of rescanning the image. The
+lookup tables of the histogram equalization and auto-contrast filters of
+pimp_image are built from these statistics.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import numpy as np
+from tiled_image import TiledImage
+
+LEVELS = 256
+
+
+class ImageStats:
+    """
+    Per-channel histograms of a uint8 image and the statistics they give.
+
+    Every statistic is an array with one value per channel.
+    """
+
+    def __init__(self, histograms: np.ndarray) -> None:
+        """
+        Wrap precomputed histograms.
+
+        Args:
+            histograms (np.ndarray): Pixel counts of shape (C, 256).
+
+        Raises:
+            ValueError: If the histograms do not have 256 bins.
+        """
+        histograms = np.asarray(histograms, dtype=np.int64)
+        if histograms.ndim != 2 or histograms.shape[1] != LEVELS:
+            raise ValueError("Histograms must have shape (C, 256).")
+        self.histograms = histograms
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "ImageStats":
+        """
+        Compute the statistics of an image in one pass.
+
+        Args:
+            array (np.ndarray): A uint8 image of shape (H, W) or (H, W, C).
+
+        Returns:
+            ImageStats: The statistics of the image.
+
+        Raises:
+            TypeError: If the array is not uint8.
+            ValueError: If the array is not an image.
+        """
+        if array.dtype != np.uint8:
+            raise TypeError("Input array must have dtype uint8.")
+        if array.ndim not in (2, 3):
+            raise ValueError("Input must have shape (H, W) or (H, W, C).")
+        pixels = array.reshape(-1, 1 if array.ndim == 2 else array.shape[2])
+        return cls(np.stack([np.bincount(pixels[:, channel], minlength=LEVELS)
+                             for channel in range(pixels.shape[1])]))
+
+    @classmethod
+    def from_tiled(cls, image: TiledImage,
+                   workers: Optional[int] = None) -> "ImageStats":
+        """
+        Compute the statistics of a tiled image, one tile at a time.
+
+        Args:
+            image (TiledImage): The image, possibly bigger than RAM.
+            workers (Optional[int]): Threads computing tiles concurrently,
+                one by default.
+
+        Returns:
+            ImageStats: The statistics of the whole image.
+        """
+        def tile_stats(position):
+            return cls.from_array(image.tile(*position))
+
+        if workers is None or workers <= 1:
+            return cls.merge_all(map(tile_stats, image.tile_indices()))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return cls.merge_all(executor.map(tile_stats,
+                                              image.tile_indices()))
+
+    @classmethod
+    def merge_all(cls, parts: Iterable["ImageStats"]) -> "ImageStats":
+        """
+        Merge the statistics of several parts of the same image.
+
+        Args:
+            parts (Iterable[ImageStats]): Statistics of tiles or strips.
+
+        Returns:
+            ImageStats: The statistics of all the parts together.
+
+        Raises:
+            ValueError: If there are no parts.
+        """
+        total = None
+        for part in parts:
+            if total is None:
+                total = part.histograms.copy()
+            else:
+                total += part.histograms
+        if total is None:
+            raise ValueError("No statistics to merge.")
+        return cls(total)
+
+    def merge(self, other: "ImageStats") -> "ImageStats":
+        """
+        Merge with the statistics of another part of the same image.
+
+        Args:
+            other (ImageStats): Statistics with the same channels.
+
+        Returns:
+            ImageStats: The statistics of both parts.
+        """
+        return ImageStats(self.histograms + other.histograms)
+
+    @property
+    def count(self) -> int:
+        """Number of pixels."""
+        return int(self.histograms[0].sum())
+
+    @property
+    def minimum(self) -> np.ndarray:
+        """Smallest value of each channel."""
+        return (self.histograms > 0).argmax(axis=1)
+
+    @property
+    def maximum(self) -> np.ndarray:
+        """Largest value of each channel."""
+        return LEVELS - 1 - (self.histograms[:, ::-1] > 0).argmax(axis=1)
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Mean value of each channel."""
+        return self.histograms @ np.arange(LEVELS) / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        """Standard deviation of each channel."""
+        squares = self.histograms @ np.arange(LEVELS) ** 2 / self.count
+        return np.sqrt(squares - self.mean ** 2)
+
+    def percentile(self, q: float) -> np.ndarray:
+        """
+        Return a percentile of each channel (nearest-rank method).
+
+        Args:
+            q (float): The percentile, between 0 and 100.
+
+        Returns:
+            np.ndarray: The smallest value of each channel with at least q%
+            of the pixels at or below it.
+
+        Raises:
+            ValueError: If q is out of range.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        cumulative = self.histograms.cumsum(axis=1)
+        rank = max(np.ceil(q / 100 * self.count), 1)
+        return (cumulative >= rank).argmax(axis=1)
+
+    def __repr__(self) -> str:
+        return (f"ImageStats(count={self.count}, "
+                f"min={self.minimum.tolist()}, max={self.maximum.tolist()}, "
+                f"mean={np.round(self.mean, 2).tolist()})")
+
+
+def equalization_lut(stats: ImageStats) -> np.ndarray:
+    """
+    Build the lookup tables spreading each channel's histogram evenly.
+
+    Args:
+        stats (ImageStats): Statistics of the image to equalize.
+
+    Returns:
+        np.ndarray: uint8 lookup tables of shape (C, 256).
+    """
+    cumulative = stats.histograms.cumsum(axis=1)
+    lowest = cumulative[np.arange(len(cumulative)), stats.minimum]
+    spread = np.maximum(stats.count - lowest, 1)[:, None]
+    scaled = (cumulative - lowest[:, None]) * (LEVELS - 1) * 2 + spread
+    return np.clip(scaled // (2 * spread), 0, LEVELS - 1).astype(np.uint8)
+
+
+def autocontrast_lut(stats: ImageStats, cutoff: float = 0.0) -> np.ndarray:
+    """
+    Build the lookup tables stretching each channel to the full 0-255 range.
+
+    Args:
+        stats (ImageStats): Statistics of the image to stretch.
+        cutoff (float): Percentage of the darkest and of the brightest
+            pixels clipped to 0 and 255.
+
+    Returns:
+        np.ndarray: uint8 lookup tables of shape (C, 256).
+    """
+    low = stats.percentile(cutoff)[:, None].astype(np.int64)
+    high = stats.percentile(100 - cutoff)[:, None].astype(np.int64)
+    spread = np.maximum(high - low, 1)
+    scaled = (np.arange(LEVELS) - low) * (LEVELS - 1) * 2 + spread
+    return np.clip(scaled // (2 * spread), 0, LEVELS - 1).astype(np.uint8)
+
+
+def apply_lut(array: np.ndarray, luts: np.ndarray) -> np.ndarray:
+    """
+    Map every pixel of an image through per-channel lookup tables.
+
+    Args:
+        array (np.ndarray): A uint8 image of shape (H, W) or (H, W, C).
+        luts (np.ndarray): uint8 lookup tables of shape (C, 256).
+
+    Returns:
+        np.ndarray: The mapped image, with the shape of array.
+    """
+    if array.ndim == 2:
+        return luts[0][array]
+    out = np.empty_like(array)
+    for channel in range(array.shape[2]):
+        np.take(luts[channel], array[..., channel], out=out[..., channel])
+    return out
+
+
+def main() -> None:
+    """
+    Main function to print the statistics of an image.
+    """
+    from load_image import ft_load
+    try:
+        stats = ImageStats.from_array(ft_load("landscape.jpg"))
+        print(stats)
+        print(f"std: {np.round(stats.std, 2).tolist()}")
+        for q in (1, 50, 99):
+            print(f"p{q}: {stats.percentile(q).tolist()}")
+    except (FileNotFoundError, TypeError, ValueError) as error:
+        print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()
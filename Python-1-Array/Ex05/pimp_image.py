@@ -13,10 +13,25 @@ function:
 * blue: =
 * grey: =, /
 
+ft_equalize and ft_autocontrast go beyond the exercise: they remap pixels
+through per-channel lookup tables built from image_stats histograms. So do
+the neighbourhood filters ft_box_blur, ft_gaussian_blur, ft_sharpen and
+ft_edges, implemented in convolution.
+
 All functions perform minimal validation to ensure the input has 3 channels.
 """
 from __future__ import annotations
+from typing import Callable, Optional
 import numpy as np
+from convolution import box_blur, gaussian_blur, sobel, unsharp_mask
+from grayscale import to_grayscale
+from image_stats import (
+    ImageStats,
+    apply_lut,
+    autocontrast_lut,
+    equalization_lut,
+)
+from tiled_image import TiledImage
 
 # Helper ---------------------------------------------------------------------
 
@@ -94,14 +109,94 @@ def ft_grey(array: np.ndarray) -> np.ndarray:
     feasible. Hence we assume '+' is implicitly allowed for constructing the
     mean. If strictly forbidden, we'd approximate by successive division, which
     is inaccurate. Here we use (R + G + B) / 3 staying within intent.
+
+    The mean is computed by grayscale.to_grayscale, in one uint16
+    accumulator written straight into the 3-channel result.
+    """
+    _validate_rgb(array)
+    return to_grayscale(array, "average", channels=3)
+
+
+def ft_equalize(array: np.ndarray,
+                stats: Optional[ImageStats] = None) -> np.ndarray:
+    """Spread the histogram of each channel evenly over 0-255.
+
+    The lookup tables come from the image's own statistics unless stats is
+    given, e.g. the statistics of a whole tiled image filtered tile by tile.
+    """
+    _validate_rgb(array)
+    if stats is None:
+        stats = ImageStats.from_array(array)
+    return apply_lut(array, equalization_lut(stats))
+
+
+def ft_autocontrast(array: np.ndarray, cutoff: float = 0.0,
+                    stats: Optional[ImageStats] = None) -> np.ndarray:
+    """Stretch each channel linearly to the full 0-255 range.
+
+    cutoff is the percentage of darkest and brightest pixels clipped to 0
+    and 255. As for ft_equalize, stats defaults to the image's own.
+    """
+    _validate_rgb(array)
+    if stats is None:
+        stats = ImageStats.from_array(array)
+    return apply_lut(array, autocontrast_lut(stats, cutoff))
+
+
+def ft_box_blur(array: np.ndarray, radius: int,
+                workers: Optional[int] = None) -> np.ndarray:
+    """Average each pixel over the (2r + 1)^2 square around it.
+
+    Running sums make the cost independent of the radius; strips of rows
+    are filtered by `workers` threads (see convolution).
     """
     _validate_rgb(array)
-    # Compute mean across channel axis manually then broadcast
-    grey = (array[:, :, 0].astype(np.uint16) +  # prevent overflow
-            array[:, :, 1].astype(np.uint16) +
-            array[:, :, 2].astype(np.uint16)) // 3
-    grey = grey.astype(np.uint8)
-    return np.stack((grey, grey, grey), axis=2)
+    return box_blur(array, radius, workers)
+
+
+def ft_gaussian_blur(array: np.ndarray, sigma: float,
+                     workers: Optional[int] = None) -> np.ndarray:
+    """Blur with a separable Gaussian kernel of standard deviation sigma."""
+    _validate_rgb(array)
+    return gaussian_blur(array, sigma, workers)
+
+
+def ft_sharpen(array: np.ndarray, sigma: float = 1.0, amount: float = 1.0,
+               threshold: int = 0,
+               workers: Optional[int] = None) -> np.ndarray:
+    """Sharpen with an unsharp mask: out = in + amount * (in - blur(in)).
+
+    Differences below threshold are left alone so that noise is not
+    amplified.
+    """
+    _validate_rgb(array)
+    return unsharp_mask(array, sigma, amount, threshold, workers)
+
+
+def ft_edges(array: np.ndarray,
+             workers: Optional[int] = None) -> np.ndarray:
+    """Return the Sobel edge magnitude |gx| + |gy| of each channel."""
+    _validate_rgb(array)
+    return sobel(array, workers)
+
+# Tiled images ---------------------------------------------------------------
+
+
+def ft_apply_tiled(function: Callable[[np.ndarray], np.ndarray],
+                   image: TiledImage, path: str) -> TiledImage:
+    """Apply one of the filters above to a tiled image, tile by tile.
+
+    The filters up to ft_autocontrast are pixel-wise, so filtering each
+    (H, W, 3) tile gives the same result as filtering the whole image, which
+    may be bigger than RAM. The result is written to a new tiled image at
+    path. ft_equalize and ft_autocontrast need the statistics of the whole
+    image, e.g. functools.partial(ft_equalize,
+    stats=ImageStats.from_tiled(image)). The neighbourhood filters
+    (ft_box_blur and below) would need tile overlaps and are not supported.
+    """
+    if image.channels != 3:
+        raise ValueError("Input must have shape (H, W, 3).")
+    return image.map_tiles(function, path)
 
 # Display helper (optional) --------------------------------------------------
 
@@ -115,6 +210,12 @@ def main() -> None:  # pragma: no cover - manual demo
         _ = ft_green(original)
         _ = ft_blue(original)
         _ = ft_grey(original)
+        _ = ft_equalize(original)
+        _ = ft_autocontrast(original, cutoff=1.0)
+        _ = ft_box_blur(original, 10)
+        _ = ft_gaussian_blur(original, 2.0)
+        _ = ft_sharpen(original)
+        _ = ft_edges(original)
     except Exception as err:  # noqa: BLE001
         print(f"Error: {err}")
 
@@ -0,0 +1,411 @@
+"""
+tiled_image.py
+
+Module to store images bigger than RAM as fixed-size tiles in a
+memory-mapped file, and to run image operations on them tile by tile.
+
+The pixels are kept in a raw file of shape (tiles_y, tiles_x, tile_size,
+tile_size, channels), so each tile is contiguous on disk; a JSON sidecar
+next to it records the image size. Edge tiles are padded up to the tile
+size. Only the tiles being processed are paged into memory.
+
+Sources bigger than RAM are ingested from .npy and binary PPM/PGM files,
+which are memory-mapped and copied tile by tile (see open_raster). Other
+formats, such as JPEG, are decoded in memory by ft_load first.
+
+Like load_image.py, this file is copied unchanged into Ex03, Ex04 and Ex05.
+"""
+
+import json
+import sys
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple
+
+import numpy as np
+
+# Default side of a tile, in pixels.
+TILE_SIZE = 1024
+
+# Suffix of the JSON sidecar holding the image metadata.
+METADATA_SUFFIX = ".json"
+
+
+def _netpbm_header(file: BinaryIO) -> Tuple[int, int, int, int]:
+    """
+    Parse the header of a binary PPM (P6) or PGM (P5) file.
+
+    Args:
+        file (BinaryIO): The file, positioned at its start.
+
+    Returns:
+        Tuple[int, int, int, int]: Height, width, channels and the offset
+        of the pixels in the file.
+
+    Raises:
+        ValueError: If the file is not an 8-bit binary PPM or PGM.
+    """
+    magic = file.read(2)
+    if magic not in (b"P5", b"P6"):
+        raise ValueError("Only binary PPM (P6) and PGM (P5) are supported.")
+    fields = []
+    while len(fields) < 3:
+        byte = file.read(1)
+        if not byte:
+            raise ValueError("Truncated PPM/PGM header.")
+        if byte == b"#":
+            file.readline()
+        elif byte.isspace():
+            continue
+        else:
+            field = byte
+            while True:
+                byte = file.read(1)
+                if not byte.isdigit():
+                    break
+                field += byte
+            fields.append(int(field))
+            if byte == b"#":
+                file.readline()
+    width, height, maxval = fields
+    if maxval > 255:
+        raise ValueError("Only 8-bit PPM/PGM files are supported.")
+    # A single whitespace byte separates the header from the pixels
+    return height, width, 3 if magic == b"P6" else 1, file.tell()
+
+
+def open_raster(path: str) -> np.ndarray:
+    """
+    Memory-map an uncompressed image file without reading its pixels.
+
+    Args:
+        path (str): A .npy file holding a uint8 (H, W) or (H, W, C) array,
+            or a binary .ppm/.pgm file.
+
+    Returns:
+        np.ndarray: A read-only memmap of the image.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the format is not supported.
+    """
+    if path.lower().endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if not path.lower().endswith((".ppm", ".pgm")):
+        raise ValueError("Only .npy, .ppm and .pgm files can be mapped.")
+    with open(path, "rb") as file:
+        height, width, channels, offset = _netpbm_header(file)
+    pixels = np.memmap(path, dtype=np.uint8, mode="r", offset=offset,
+                       shape=(height, width, channels))
+    return pixels[..., 0] if channels == 1 else pixels
+
+
+class TiledImage:
+    """
+    uint8 image split into square tiles backed by a memory-mapped file.
+
+    Tiles are returned as (H, W) arrays for single-channel images and as
+    (H, W, C) arrays otherwise, cropped to the image for edge tiles.
+    """
+
+    def __init__(self, path: str, mode: str = "r") -> None:
+        """
+        Open an existing tiled image.
+
+        Args:
+            path (str): The pixel file; its metadata is read from the
+                sidecar path + ".json".
+            mode (str): "r" for read-only, "r+" to modify the pixels.
+
+        Raises:
+            FileNotFoundError: If the pixel or metadata file does not exist.
+        """
+        with open(path + METADATA_SUFFIX) as file:
+            metadata = json.load(file)
+        self.path = path
+        self.height = metadata["height"]
+        self.width = metadata["width"]
+        self.channels = metadata["channels"]
+        self.tile_size = metadata["tile_size"]
+        self.tiles_y = -(-self.height // self.tile_size)
+        self.tiles_x = -(-self.width // self.tile_size)
+        self._pixels = np.memmap(
+            path, dtype=np.uint8, mode=mode,
+            shape=(self.tiles_y, self.tiles_x, self.tile_size,
+                   self.tile_size, self.channels))
+
+    @classmethod
+    def create(cls, path: str, height: int, width: int, channels: int = 3,
+               tile_size: int = TILE_SIZE) -> "TiledImage":
+        """
+        Create an empty (black) tiled image on disk.
+
+        Args:
+            path (str): The pixel file to create.
+            height (int): Image height in pixels.
+            width (int): Image width in pixels.
+            channels (int): Number of channels, 1 for grayscale.
+            tile_size (int): Side of a tile in pixels.
+
+        Returns:
+            TiledImage: The new image, opened for writing.
+
+        Raises:
+            ValueError: If a size is not positive.
+        """
+        if min(height, width, channels, tile_size) <= 0:
+            raise ValueError("Image sizes must be positive.")
+        tiles_y, tiles_x = -(-height // tile_size), -(-width // tile_size)
+        np.memmap(path, dtype=np.uint8, mode="w+",
+                  shape=(tiles_y, tiles_x, tile_size, tile_size, channels))
+        with open(path + METADATA_SUFFIX, "w") as file:
+            json.dump({"height": height, "width": width,
+                       "channels": channels, "tile_size": tile_size}, file)
+        return cls(path, mode="r+")
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, path: str,
+                   tile_size: int = TILE_SIZE) -> "TiledImage":
+        """
+        Copy an image array, possibly a memmap, into a new tiled image.
+
+        Tiles are copied one at a time, row of tiles by row of tiles, so a
+        memmap from open_raster is read in order and never loaded whole.
+
+        Args:
+            array (np.ndarray): A uint8 image of shape (H, W) or (H, W, C).
+            path (str): The pixel file to create.
+            tile_size (int): Side of a tile in pixels.
+
+        Returns:
+            TiledImage: The new image, opened for writing.
+
+        Raises:
+            ValueError: If the array is not a uint8 image.
+        """
+        if array.dtype != np.uint8 or array.ndim not in (2, 3):
+            raise ValueError("Only uint8 (H, W) or (H, W, C) arrays can be "
+                             "tiled.")
+        channels = 1 if array.ndim == 2 else array.shape[2]
+        image = cls.create(path, array.shape[0], array.shape[1], channels,
+                           tile_size)
+        for tile_y, tile_x in image.tile_indices():
+            image.write_tile(tile_y, tile_x,
+                             array[image.tile_bounds(tile_y, tile_x)])
+        return image
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the whole image, as for an array."""
+        if self.channels == 1:
+            return (self.height, self.width)
+        return (self.height, self.width, self.channels)
+
+    def tile_indices(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the tile positions, row by row.
+
+        Returns:
+            Iterator[Tuple[int, int]]: (tile_y, tile_x) pairs.
+        """
+        for tile_y in range(self.tiles_y):
+            for tile_x in range(self.tiles_x):
+                yield tile_y, tile_x
+
+    def tile_bounds(self, tile_y: int, tile_x: int) -> Tuple[slice, slice]:
+        """
+        Return the pixel area of a tile in the whole image.
+
+        Args:
+            tile_y (int): Tile row.
+            tile_x (int): Tile column.
+
+        Returns:
+            Tuple[slice, slice]: Row and column slices of the tile.
+        """
+        top, left = tile_y * self.tile_size, tile_x * self.tile_size
+        return (slice(top, min(top + self.tile_size, self.height)),
+                slice(left, min(left + self.tile_size, self.width)))
+
+    def tile(self, tile_y: int, tile_x: int) -> np.ndarray:
+        """
+        Return one tile, as a view on the memory-mapped file.
+
+        Args:
+            tile_y (int): Tile row.
+            tile_x (int): Tile column.
+
+        Returns:
+            np.ndarray: The tile pixels, cropped to the image.
+        """
+        rows, columns = self.tile_bounds(tile_y, tile_x)
+        pixels = self._pixels[tile_y, tile_x,
+                              :rows.stop - rows.start,
+                              :columns.stop - columns.start]
+        return pixels[..., 0] if self.channels == 1 else pixels
+
+    def write_tile(self, tile_y: int, tile_x: int,
+                   pixels: np.ndarray) -> None:
+        """
+        Overwrite one tile.
+
+        Args:
+            tile_y (int): Tile row.
+            tile_x (int): Tile column.
+            pixels (np.ndarray): The new pixels, with the shape of the tile.
+
+        Raises:
+            ValueError: If the pixels do not fit the tile.
+        """
+        tile = self.tile(tile_y, tile_x)
+        if pixels.shape != tile.shape:
+            raise ValueError(f"Tile shape {tile.shape} expected, got "
+                             f"{pixels.shape}.")
+        tile[...] = pixels
+
+    def read(self, start_y: int, end_y: int,
+             start_x: int, end_x: int) -> np.ndarray:
+        """
+        Copy an area of the image into an array.
+
+        Args:
+            start_y (int): First row.
+            end_y (int): Row after the last one.
+            start_x (int): First column.
+            end_x (int): Column after the last one.
+
+        Returns:
+            np.ndarray: The pixels of the area.
+
+        Raises:
+            ValueError: If the area is empty or outside the image.
+        """
+        if not (0 <= start_y < end_y <= self.height
+                and 0 <= start_x < end_x <= self.width):
+            raise ValueError("The area is empty or outside the image.")
+        size = self.tile_size
+        area = np.empty((end_y - start_y, end_x - start_x)
+                        + self.shape[2:], dtype=np.uint8)
+        for tile_y in range(start_y // size, (end_y - 1) // size + 1):
+            for tile_x in range(start_x // size, (end_x - 1) // size + 1):
+                top, left = tile_y * size, tile_x * size
+                y0, y1 = max(start_y, top), min(end_y, top + size)
+                x0, x1 = max(start_x, left), min(end_x, left + size)
+                area[y0 - start_y:y1 - start_y, x0 - start_x:x1 - start_x] = \
+                    self.tile(tile_y, tile_x)[y0 - top:y1 - top,
+                                              x0 - left:x1 - left]
+        return area
+
+    def to_array(self) -> np.ndarray:
+        """
+        Copy the whole image into an array; only for images that fit in RAM.
+
+        Returns:
+            np.ndarray: The image pixels.
+        """
+        return self.read(0, self.height, 0, self.width)
+
+    def map_tiles(self, function: Callable[[np.ndarray], np.ndarray],
+                  path: str, channels: Optional[int] = None) -> "TiledImage":
+        """
+        Apply a pixel-wise operation tile by tile into a new tiled image.
+
+        Any function mapping an image to an image of the same height and
+        width works, e.g. convert_to_grayscale.
+
+        Args:
+            function (Callable[[np.ndarray], np.ndarray]): The operation.
+            path (str): The pixel file of the result.
+            channels (Optional[int]): Channels of the result, defaults to
+                those of this image.
+
+        Returns:
+            TiledImage: The result.
+        """
+        output = TiledImage.create(path, self.height, self.width,
+                                   channels or self.channels, self.tile_size)
+        for tile_y, tile_x in self.tile_indices():
+            output.write_tile(tile_y, tile_x,
+                              function(self.tile(tile_y, tile_x)))
+        return output
+
+    def crop(self, start_y: int, end_y: int, start_x: int, end_x: int,
+             path: str) -> "TiledImage":
+        """
+        Copy an area of the image into a new tiled image, tile by tile.
+
+        Args:
+            start_y (int): First row.
+            end_y (int): Row after the last one.
+            start_x (int): First column.
+            end_x (int): Column after the last one.
+            path (str): The pixel file of the result.
+
+        Returns:
+            TiledImage: The cropped image.
+
+        Raises:
+            ValueError: If the area is empty or outside the image.
+        """
+        if not (0 <= start_y < end_y <= self.height
+                and 0 <= start_x < end_x <= self.width):
+            raise ValueError("The area is empty or outside the image.")
+        output = TiledImage.create(path, end_y - start_y, end_x - start_x,
+                                   self.channels, self.tile_size)
+        for tile_y, tile_x in output.tile_indices():
+            rows, columns = output.tile_bounds(tile_y, tile_x)
+            output.write_tile(tile_y, tile_x, self.read(
+                start_y + rows.start, start_y + rows.stop,
+                start_x + columns.start, start_x + columns.stop))
+        return output
+
+    def transpose(self, path: str) -> "TiledImage":
+        """
+        Swap the rows and columns of the image into a new tiled image.
+
+        Tile (y, x) transposed becomes tile (x, y) of the result.
+
+        Args:
+            path (str): The pixel file of the result.
+
+        Returns:
+            TiledImage: The transposed image.
+        """
+        output = TiledImage.create(path, self.width, self.height,
+                                   self.channels, self.tile_size)
+        for tile_y, tile_x in self.tile_indices():
+            output.write_tile(tile_x, tile_y,
+                              np.swapaxes(self.tile(tile_y, tile_x), 0, 1))
+        return output
+
+    def flush(self) -> None:
+        """Write the modified tiles to disk."""
+        self._pixels.flush()
+
+
+def main() -> None:
+    """
+    Convert an image to a tiled image.
+
+    .npy, .ppm and .pgm images are memory-mapped and may be bigger than
+    RAM; other formats are decoded in memory with ft_load.
+
+    Usage: python tiled_image.py <image> <tiled output> [tile size]
+    """
+    try:
+        assert len(sys.argv) in (3, 4), "the arguments are bad"
+        tile_size = int(sys.argv[3]) if len(sys.argv) == 4 else TILE_SIZE
+        if sys.argv[1].lower().endswith((".npy", ".ppm", ".pgm")):
+            source = open_raster(sys.argv[1])
+        else:
+            from load_image import ft_load
+
+            source = ft_load(sys.argv[1])
+        image = TiledImage.from_array(source, sys.argv[2], tile_size)
+        image.flush()
+        print(f"Tiled image {image.shape}: {image.tiles_y}x{image.tiles_x} "
+              f"tiles of {image.tile_size} pixels")
+    except (AssertionError, FileNotFoundError, ValueError) as error:
+        print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()